@@ -1,6 +1,10 @@
 """Pytest fixtures for evaluation runs."""
-import json
+import functools
+import os
+from collections import defaultdict
 from pathlib import Path
+
+import orjson
 import pytest
 
 from src.config import AppConfig
@@ -32,21 +36,44 @@ def eval_workflow(eval_config):
     return builder.build(), builder.tool_manager
 
 
-def load_scenarios(category: str | None = None) -> list[dict]:
-    """Load scenarios from JSON files, optionally filtered by category."""
+@functools.lru_cache(maxsize=1)
+def _load_all() -> tuple[list[dict], dict[str, list[dict]]]:
+    """Read and parse every scenario file once per process.
+
+    Returns all scenarios in file order plus an index of them by category.
+    """
+    with os.scandir(SCENARIOS_DIR) as it:
+        entries = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
+
     scenarios = []
-    for path in sorted(SCENARIOS_DIR.glob("*.json")):
-        with open(path) as f:
-            data = json.load(f)
+    by_category: defaultdict[str, list[dict]] = defaultdict(list)
+    for entry in entries:
+        with open(entry.path, "rb") as f:
+            data = orjson.loads(f.read())
         for s in data["scenarios"]:
-            if category is None or s["category"] == category:
-                scenarios.append(s)
-    return scenarios
+            scenarios.append(s)
+            by_category[s["category"]].append(s)
+    return scenarios, dict(by_category)
+
+
+def load_scenarios(category: str | None = None) -> list[dict]:
+    """Load scenarios from JSON files, optionally filtered by category."""
+    scenarios, by_category = _load_all()
+    if category is None:
+        return list(scenarios)
+    return list(by_category.get(category, []))
+
+
+@functools.lru_cache(maxsize=64)
+def _read_fixture_bytes(path: str) -> bytes:
+    return Path(path).read_bytes()
 
 
 def load_pdf_fixture(fixture_path: str) -> bytes | None:
-    """Load a PDF fixture by relative path."""
+    """Load a PDF fixture by relative path. Contents are cached after the first read."""
     if not fixture_path:
         return None
-    path = FIXTURES_DIR / fixture_path
-    return path.read_bytes() if path.exists() else None
+    try:
+        return _read_fixture_bytes(str(FIXTURES_DIR / fixture_path))
+    except FileNotFoundError:
+        return None
@@ -1,23 +1,37 @@
 """PDF fixture generator for evaluation scenarios.
 
 Generates PDFs using reportlab that match the structure of purchase order documents.
-Each PDF has a companion JSON file with ground truth extraction data.
+Ground truth extraction data for every PO fixture is written to a single
+`ground_truth.json`, keyed by fixture id.
+
+Unchanged fixtures are skipped: a `.hash` sidecar next to each PDF records the
+config and renderer version it was rendered from; bump `_RENDERER_VERSION`
+whenever the PDF builders change.
 
 Usage:
     python -m evals.generate_fixtures
+    python -m evals.generate_fixtures --force
 """
-import json
+import argparse
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import orjson
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
+from reportlab.pdfgen import canvas
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
 
 FIXTURES_DIR = Path("evals/fixtures")
 
+# Part of every fixture's hash, so a layout change re-renders existing PDFs
+_RENDERER_VERSION = 1
+
 FIXTURE_CONFIGS = [
     # ── Happy path — complete POs ──
     {
@@ -363,102 +377,128 @@ FIELD_LABELS = {
     "driver_name": "Truck Driver",
     "driver_phone": "Driver Phone",
 }
+_FIELD_ITEMS = tuple(FIELD_LABELS.items())
+
+# Column views of FIXTURE_CONFIGS for passes that only need one attribute per fixture
+_IDS = tuple(config["id"] for config in FIXTURE_CONFIGS)
+_CATEGORIES = tuple(config["category"] for config in FIXTURE_CONFIGS)
+_FIELDS = tuple(config.get("fields") for config in FIXTURE_CONFIGS)
+
+# Shuffle-ish: malformed PDFs list fields in this odd order
+_SCRAMBLED_ORDER = (
+    "pickup_location", "order_id", "driver_name", "customer",
+    "delivery_datetime", "delivery_location", "driver_phone",
+)
+
+# Styles are immutable once built; getSampleStyleSheet() is costly, so build them once at import
+_STYLES = getSampleStyleSheet()
+_PO_TITLE_STYLE = ParagraphStyle("POTitle", parent=_STYLES["Title"], fontSize=20, spaceAfter=20)
+_FOOTER_STYLE = ParagraphStyle("Footer", parent=_STYLES["Normal"], fontSize=9, textColor=colors.grey)
+_PO_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#e8e8e8")),
+    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+    ("FONTNAME", (1, 0), (1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 0), (-1, -1), 11),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("TOPPADDING", (0, 0), (-1, -1), 8),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+    ("LEFTPADDING", (0, 0), (-1, -1), 10),
+])
+
+
+_DOC_KWARGS = {"pagesize": A4, "topMargin": 2 * cm, "bottomMargin": 2 * cm}
+
+# Canvas geometry for the layouts drawn without Platypus
+_PAGE_WIDTH, _PAGE_HEIGHT = A4
+_CANVAS_LEFT = 2 * cm
+_CANVAS_TOP = _PAGE_HEIGHT - 3 * cm
+_CANVAS_LEADING = 16
+
+
+def _new_doc(path: Path) -> SimpleDocTemplate:
+    """Create a document with the page setup shared by every fixture layout."""
+    return SimpleDocTemplate(str(path), **_DOC_KWARGS)
 
 
 def build_standard_pdf(path: Path, fields: dict) -> None:
     """Generate a standard PO PDF with a table-like layout."""
-    doc = SimpleDocTemplate(str(path), pagesize=A4, topMargin=2 * cm, bottomMargin=2 * cm)
-    styles = getSampleStyleSheet()
+    doc = _new_doc(path)
     elements = []
 
     # Title
-    title_style = ParagraphStyle("POTitle", parent=styles["Title"], fontSize=20, spaceAfter=20)
-    elements.append(Paragraph("Purchase Order", title_style))
+    elements.append(Paragraph("Purchase Order", _PO_TITLE_STYLE))
     elements.append(Spacer(1, 0.5 * cm))
 
     # Fields table
-    table_data = []
-    for key, label in FIELD_LABELS.items():
-        value = fields.get(key)
-        display = value if value is not None else ""
-        table_data.append([label, display])
+    get = fields.get
+    table_data = [[label, get(key) or ""] for key, label in _FIELD_ITEMS]
 
     table = Table(table_data, colWidths=[5 * cm, 12 * cm])
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#e8e8e8")),
-        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-        ("FONTNAME", (1, 0), (1, -1), "Helvetica"),
-        ("FONTSIZE", (0, 0), (-1, -1), 11),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING", (0, 0), (-1, -1), 8),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-        ("LEFTPADDING", (0, 0), (-1, -1), 10),
-    ]))
+    table.setStyle(_PO_TABLE_STYLE)
     elements.append(table)
     elements.append(Spacer(1, 1 * cm))
 
     # Footer
-    footer_style = ParagraphStyle("Footer", parent=styles["Normal"], fontSize=9, textColor=colors.grey)
     elements.append(Paragraph(
         "Please handle with care. Ensure delivery is completed within the specified timeframe. "
         "Contact the driver directly for any scheduling changes.",
-        footer_style,
+        _FOOTER_STYLE,
     ))
 
     doc.build(elements)
 
 
 def build_scrambled_pdf(path: Path, fields: dict) -> None:
-    """Generate a malformed PO PDF with non-standard layout."""
-    doc = SimpleDocTemplate(str(path), pagesize=A4, topMargin=2 * cm, bottomMargin=2 * cm)
-    styles = getSampleStyleSheet()
-    elements = []
+    """Generate a malformed PO PDF with non-standard layout.
+
+    Drawn directly on a canvas: fixed lines need none of Platypus's flow layout.
+    """
+    c = canvas.Canvas(str(path), pagesize=A4)
+    y = _CANVAS_TOP
 
     # Messy title
-    title_style = ParagraphStyle("MessyTitle", parent=styles["Title"], fontSize=16, spaceAfter=10)
-    elements.append(Paragraph("PURCHASE ORDER // ORDEN DE COMPRA", title_style))
-    elements.append(Spacer(1, 0.3 * cm))
-
-    # Dump fields as plain text paragraphs (no table structure)
-    body_style = ParagraphStyle("Body", parent=styles["Normal"], fontSize=11, leading=16)
-    field_order = list(fields.keys())
-    # Shuffle-ish: put some fields in odd order
-    reordered = [field_order[2], field_order[0], field_order[5], field_order[1],
-                 field_order[4], field_order[3], field_order[6]]
-
-    for key in reordered:
+    c.setFont("Helvetica-Bold", 16)
+    c.drawCentredString(_PAGE_WIDTH / 2, y, "PURCHASE ORDER // ORDEN DE COMPRA")
+    y -= 1.2 * cm
+
+    # Dump fields as plain text lines (no table structure)
+    for key in _SCRAMBLED_ORDER:
         value = fields.get(key)
         if value is not None:
-            label = FIELD_LABELS.get(key, key)
-            elements.append(Paragraph(f"<b>{label}:</b> {value}", body_style))
-            elements.append(Spacer(1, 0.2 * cm))
+            label = f"{FIELD_LABELS.get(key, key)}: "
+            c.setFont("Helvetica-Bold", 11)
+            c.drawString(_CANVAS_LEFT, y, label)
+            c.setFont("Helvetica", 11)
+            c.drawString(_CANVAS_LEFT + c.stringWidth(label, "Helvetica-Bold", 11), y, str(value))
+            y -= _CANVAS_LEADING + 0.2 * cm
 
-    elements.append(Spacer(1, 0.5 * cm))
-    note_style = ParagraphStyle("Note", parent=styles["Normal"], fontSize=8, textColor=colors.grey)
-    elements.append(Paragraph("--- Documento generado automáticamente / Auto-generated document ---", note_style))
+    y -= 0.5 * cm
+    c.setFont("Helvetica", 8)
+    c.setFillColor(colors.grey)
+    c.drawString(_CANVAS_LEFT, y, "--- Documento generado automáticamente / Auto-generated document ---")
 
-    doc.build(elements)
+    c.save()
 
 
 def build_non_po_pdf(path: Path, title: str, body_text: str) -> None:
     """Generate a non-PO PDF (invoice, newsletter, etc.)."""
-    doc = SimpleDocTemplate(str(path), pagesize=A4, topMargin=2 * cm, bottomMargin=2 * cm)
-    styles = getSampleStyleSheet()
-    elements = []
+    c = canvas.Canvas(str(path), pagesize=A4)
+    y = _CANVAS_TOP
 
-    title_style = ParagraphStyle("DocTitle", parent=styles["Title"], fontSize=18, spaceAfter=20)
-    elements.append(Paragraph(title, title_style))
-    elements.append(Spacer(1, 0.5 * cm))
+    c.setFont("Helvetica-Bold", 18)
+    c.drawCentredString(_PAGE_WIDTH / 2, y, title)
+    y -= 1.5 * cm
 
-    body_style = ParagraphStyle("Body", parent=styles["Normal"], fontSize=11, leading=16)
+    c.setFont("Helvetica", 11)
     for line in body_text.split("\n"):
         if line.strip():
-            elements.append(Paragraph(line, body_style))
+            c.drawString(_CANVAS_LEFT, y, line)
+            y -= _CANVAS_LEADING
         else:
-            elements.append(Spacer(1, 0.3 * cm))
+            y -= 0.3 * cm
 
-    doc.build(elements)
+    c.save()
 
 
 def build_ground_truth(config: dict) -> dict | None:
@@ -466,49 +506,84 @@ def build_ground_truth(config: dict) -> dict | None:
     if "fields" not in config:
         return None
 
-    fields = config["fields"]
-    return {
-        "order_id": fields.get("order_id"),
-        "customer": fields.get("customer"),
-        "pickup_location": fields.get("pickup_location"),
-        "delivery_location": fields.get("delivery_location"),
-        "delivery_datetime": fields.get("delivery_datetime"),
-        "driver_name": fields.get("driver_name"),
-        "driver_phone": fields.get("driver_phone"),
-    }
+    return _ground_truth(config["fields"])
 
 
-def generate_all():
-    """Generate all PDF fixtures and companion JSON files."""
-    count = 0
-    for config in FIXTURE_CONFIGS:
-        category = config["category"]
-        fixture_id = config["id"]
+def _ground_truth(fields: dict) -> dict:
+    get = fields.get
+    return {key: get(key) for key in FIELD_LABELS}
 
-        category_dir = FIXTURES_DIR / category
-        category_dir.mkdir(parents=True, exist_ok=True)
 
-        pdf_path = category_dir / f"{fixture_id}.pdf"
+def _config_hash(config: dict) -> str:
+    payload = orjson.dumps({"renderer": _RENDERER_VERSION, "config": config}, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-        if config["category"] == "not_a_po":
-            build_non_po_pdf(pdf_path, config["title"], config["body_text"])
-        elif config.get("layout") == "scrambled":
-            build_scrambled_pdf(pdf_path, config["fields"])
-        else:
-            build_standard_pdf(pdf_path, config["fields"])
 
-        # Ground truth JSON
-        ground_truth = build_ground_truth(config)
-        if ground_truth is not None:
-            json_path = category_dir / f"{fixture_id}.json"
-            with open(json_path, "w") as f:
-                json.dump(ground_truth, f, indent=2, ensure_ascii=False)
+def _is_up_to_date(config: dict) -> bool:
+    """True if the fixture's PDF exists and was rendered from this exact config."""
+    category_dir = FIXTURES_DIR / config["category"]
+    hash_path = category_dir / f"{config['id']}.hash"
+    if not (category_dir / f"{config['id']}.pdf").exists():
+        return False
+    try:
+        return hash_path.read_text() == _config_hash(config)
+    except FileNotFoundError:
+        return False
+
+
+def _render_one(config: dict) -> tuple[str, str]:
+    """Render one fixture's PDF. Returns (category, fixture_id)."""
+    category = config["category"]
+    fixture_id = config["id"]
+    category_dir = FIXTURES_DIR / category
+    pdf_path = category_dir / f"{fixture_id}.pdf"
+
+    if category == "not_a_po":
+        build_non_po_pdf(pdf_path, config["title"], config["body_text"])
+    elif config.get("layout") == "scrambled":
+        build_scrambled_pdf(pdf_path, config["fields"])
+    else:
+        build_standard_pdf(pdf_path, config["fields"])
+
+    # Written last so an interrupted render is redone on the next run
+    (category_dir / f"{fixture_id}.hash").write_text(_config_hash(config))
+    return category, fixture_id
 
-        count += 1
-        print(f"  Generated: {category}/{fixture_id}.pdf")
 
-    print(f"\nTotal: {count} fixtures generated in {FIXTURES_DIR}")
+def generate_all(force: bool = False):
+    """Generate all PDF fixtures and the ground truth JSON file.
+
+    Rendering is CPU-bound and each fixture is independent, so PDFs are built
+    in a process pool (threads would serialize on the GIL inside reportlab).
+    Fixtures whose config has not changed since the last run are skipped
+    unless `force` is set.
+    """
+    for category in set(_CATEGORIES):
+        (FIXTURES_DIR / category).mkdir(parents=True, exist_ok=True)
+
+    pending = [config for config in FIXTURE_CONFIGS if force or not _is_up_to_date(config)]
+    skipped = len(FIXTURE_CONFIGS) - len(pending)
+
+    count = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for category, fixture_id in executor.map(_render_one, pending, chunksize=4):
+                count += 1
+                print(f"  Generated: {category}/{fixture_id}.pdf")
+
+    # Ground truth is cheap to build, so it is always rewritten in one go
+    all_truth = {
+        fixture_id: _ground_truth(fields)
+        for fixture_id, fields in zip(_IDS, _FIELDS)
+        if fields is not None
+    }
+    (FIXTURES_DIR / "ground_truth.json").write_bytes(orjson.dumps(all_truth, option=orjson.OPT_INDENT_2))
+
+    print(f"\nTotal: {count} fixtures generated, {skipped} up to date in {FIXTURES_DIR}")
 
 
 if __name__ == "__main__":
-    generate_all()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="Regenerate fixtures even if up to date")
+    args = parser.parse_args()
+    generate_all(force=args.force)
@@ -7,9 +7,8 @@ class ClassificationAccuracy(BaseMetric):
     name = "classification_accuracy"
 
     def score(self, is_valid_po: bool, expected_is_valid_po: bool, **kwargs) -> ScoreResult:
-        correct = is_valid_po == expected_is_valid_po
         return ScoreResult(
-            value=1.0 if correct else 0.0,
+            value=float(is_valid_po == expected_is_valid_po),
             name=self.name,
             reason=f"Expected {expected_is_valid_po}, got {is_valid_po}",
         )
@@ -1,7 +1,13 @@
+import re
+
 from opik.evaluation.metrics import BaseMetric
 from opik.evaluation.metrics.score_result import ScoreResult
 
 
+_CONFIRMATION_WORDS = ("confirm", "received", "processing", "recibido", "procesando")
+_CONFIRMATION_RE = re.compile("|".join(map(re.escape, _CONFIRMATION_WORDS)))
+
+
 class EmailQuality(BaseMetric):
     """LLM-as-judge evaluation of the email response quality.
 
@@ -25,6 +31,7 @@ class EmailQuality(BaseMetric):
             return ScoreResult(value=0.0, name=self.name, reason="No email sent")
 
         # Phase 1: heuristic checks only. LLM-as-judge in Phase 2.
+        email_lower = email_body.lower()
         checks = []
         score = 0.0
 
@@ -40,14 +47,13 @@ class EmailQuality(BaseMetric):
             checks.append("mentions_po_id")
 
         # Check 3: Contains confirmation language
-        confirmation_words = ["confirm", "received", "processing", "recibido", "procesando"]
-        if any(w in email_body.lower() for w in confirmation_words):
+        if _CONFIRMATION_RE.search(email_lower):
             score += 0.25
             checks.append("confirmation_language")
 
         # Check 4: Contains customer name if available
         customer = (expected_extracted_data or {}).get("customer", "")
-        if customer and customer.lower() in email_body.lower():
+        if customer and customer.lower() in email_lower:
             score += 0.25
             checks.append("mentions_customer")
 
@@ -2,10 +2,19 @@ from opik.evaluation.metrics import BaseMetric
 from opik.evaluation.metrics.score_result import ScoreResult
 
 
-EXTRACTION_FIELDS = [
+EXTRACTION_FIELDS = (
     "order_id", "customer", "pickup_location", "delivery_location",
     "delivery_datetime", "driver_name", "driver_phone",
-]
+)
+
+
+def _normalize(value: str | None) -> str | None:
+    """Normalize for comparison: lowercase, strip whitespace."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.strip().lower()
+    return str(value).strip().lower()
 
 
 class ExtractionAccuracy(BaseMetric):
@@ -20,34 +29,41 @@ class ExtractionAccuracy(BaseMetric):
         if extracted_data is None:
             return ScoreResult(value=0.0, name=self.name, reason="No data extracted")
 
+        expected_get = expected_extracted_data.get
+        actual_get = extracted_data.get
         correct = 0
         total = len(EXTRACTION_FIELDS)
-        mismatches = []
+        mismatched = []
 
         for field in EXTRACTION_FIELDS:
-            expected = expected_extracted_data.get(field)
-            actual = extracted_data.get(field)
-
+            expected = expected_get(field)
             if expected is None:
                 # Field intentionally missing in ground truth — skip
                 total -= 1
                 continue
 
-            if self._normalize(actual) == self._normalize(expected):
+            if _normalize(actual_get(field)) == _normalize(expected):
                 correct += 1
             else:
-                mismatches.append(f"{field}: expected '{expected}', got '{actual}'")
+                mismatched.append(field)
 
         score = correct / total if total > 0 else 1.0
+        if not mismatched:
+            return ScoreResult(value=score, name=self.name, reason=f"{correct}/{total} fields correct")
+
+        mismatches = [f"{f}: expected '{expected_get(f)}', got '{actual_get(f)}'" for f in mismatched]
         return ScoreResult(
             value=score,
             name=self.name,
-            reason=f"{correct}/{total} fields correct. Mismatches: {mismatches}" if mismatches else f"{correct}/{total} fields correct",
+            reason=f"{correct}/{total} fields correct. Mismatches: {mismatches}",
         )
 
-    @staticmethod
-    def _normalize(value: str | None) -> str | None:
-        """Normalize for comparison: lowercase, strip whitespace."""
-        if value is None:
-            return None
-        return str(value).strip().lower()
+    def score_batch(
+        self, extracted_list: list[dict | None], expected_list: list[dict | None]
+    ) -> list[ScoreResult]:
+        """Score many rows in one call. Inputs are paired positionally and must be the same length."""
+        score = self.score
+        return [
+            score(extracted_data=extracted, expected_extracted_data=expected)
+            for extracted, expected in zip(extracted_list, expected_list, strict=True)
+        ]
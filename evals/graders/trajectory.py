@@ -7,9 +7,8 @@ class TrajectoryCorrectness(BaseMetric):
     name = "trajectory_correctness"
 
     def score(self, trajectory: list[str], expected_trajectory: list[str], **kwargs) -> ScoreResult:
-        correct = trajectory == expected_trajectory
         return ScoreResult(
-            value=1.0 if correct else 0.0,
+            value=float(trajectory == expected_trajectory),
             name=self.name,
             reason=f"Expected {expected_trajectory}, got {trajectory}",
         )
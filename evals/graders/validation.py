@@ -6,19 +6,30 @@ class ValidationCorrectness(BaseMetric):
     """Checks that missing fields were correctly identified."""
     name = "validation_correctness"
 
-    def score(self, missing_fields: list[str], expected_missing_fields: list[str], **kwargs) -> ScoreResult:
-        expected_set = set(expected_missing_fields)
-        actual_set = set(missing_fields)
+    def score(
+        self, missing_fields: list[str], expected_missing_fields: list[str], verbose: bool = True, **kwargs
+    ) -> ScoreResult:
+        """Score missing-field detection as F1.
+
+        `verbose` defaults to True because Opik's evaluate() calls score() with
+        just the task output and dataset fields, so run_eval can't pass it, and
+        experiments need the reason. Offline/bulk callers may pass False to skip formatting it.
+        """
+        expected_set = frozenset(expected_missing_fields)
+        actual_set = frozenset(missing_fields)
 
         if not expected_set and not actual_set:
             return ScoreResult(value=1.0, name=self.name, reason="No missing fields expected or found")
 
-        precision = len(expected_set & actual_set) / len(actual_set) if actual_set else (1.0 if not expected_set else 0.0)
-        recall = len(expected_set & actual_set) / len(expected_set) if expected_set else 1.0
+        overlap = len(expected_set & actual_set)
+        precision = overlap / len(actual_set) if actual_set else (1.0 if not expected_set else 0.0)
+        recall = overlap / len(expected_set) if expected_set else 1.0
         f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
 
-        return ScoreResult(
-            value=f1,
-            name=self.name,
-            reason=f"P={precision:.2f} R={recall:.2f} F1={f1:.2f}. Expected: {expected_set}, Got: {actual_set}",
-        )
+        reason = None
+        if verbose:
+            reason = (
+                f"P={precision:.2f} R={recall:.2f} F1={f1:.2f}. "
+                f"Expected: {set(expected_set)}, Got: {set(actual_set)}"
+            )
+        return ScoreResult(value=f1, name=self.name, reason=reason)
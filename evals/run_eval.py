@@ -6,11 +6,13 @@ Usage:
     python -m evals.run_eval
     python -m evals.run_eval --category happy_path
 """
-import json
 import argparse
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import opik
+import orjson
 from opik import Opik
 from opik.evaluation import evaluate
 
@@ -27,21 +29,54 @@ from src.builder import WorkflowBuilder
 SCENARIOS_DIR = Path("evals/scenarios")
 FIXTURES_DIR = Path("evals/fixtures")
 
+_REQUIRED_INPUT_KEYS = ("email_subject", "email_body", "email_sender", "has_attachment")
+_INPUT_STATE_TEMPLATE = {"email_message_id": "test", "pdf_bytes": None}
+
 
 def load_scenarios(category: str | None = None) -> list[dict]:
-    """Load scenarios from JSON files, optionally filtered by category."""
+    """Load scenarios from JSON files, optionally filtered by category.
+
+    Scenario files are named after their category, so a category-scoped run
+    reads only `<category>.json` when it exists and scans every file otherwise.
+    """
+    category_path = SCENARIOS_DIR / f"{category}.json" if category else None
+    if category_path is not None and category_path.is_file():
+        paths = [category_path]
+    else:
+        with os.scandir(SCENARIOS_DIR) as it:
+            paths = sorted(e.path for e in it if e.name.endswith(".json"))
+
     scenarios = []
-    for path in SCENARIOS_DIR.glob("*.json"):
-        with open(path) as f:
-            data = json.load(f)
-        for s in data["scenarios"]:
-            if category is None or s["category"] == category:
-                scenarios.append(s)
+    for path in paths:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+        if category is None:
+            scenarios.extend(data["scenarios"])
+        else:
+            scenarios.extend(s for s in data["scenarios"] if s["category"] == category)
     return scenarios
 
 
-def build_eval_task(workflow, mock_tools):
+def _read_fixture(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def prefetch_pdf_fixtures(scenarios: list[dict], pool: ThreadPoolExecutor) -> dict[str, Future]:
+    """Start reading every distinct PDF fixture the scenarios reference.
+
+    Reads overlap with workflow runs (dominated by LLM latency) instead of
+    happening inline before each one.
+    """
+    fixtures = {s["input"].get("pdf_fixture") for s in scenarios} - {None, ""}
+    return {fixture: pool.submit(_read_fixture, FIXTURES_DIR / fixture) for fixture in fixtures}
+
+
+def build_eval_task(workflow, mock_tools, pdf_cache: dict[str, Future] | None = None):
     """Build the task function that opik.evaluate() will call for each scenario."""
+    pdf_cache = {} if pdf_cache is None else pdf_cache
 
     @opik.track(name="po_workflow")
     def eval_task(scenario: dict) -> dict:
@@ -51,42 +86,47 @@ def build_eval_task(workflow, mock_tools):
         pdf_bytes = None
         pdf_fixture = scenario["input"].get("pdf_fixture")
         if pdf_fixture:
-            pdf_path = FIXTURES_DIR / pdf_fixture
-            if pdf_path.exists():
-                pdf_bytes = pdf_path.read_bytes()
-
-        # Build workflow input state
-        input_state = {
-            "email_subject": scenario["input"]["email_subject"],
-            "email_body": scenario["input"]["email_body"],
-            "email_sender": scenario["input"]["email_sender"],
-            "email_message_id": scenario["input"].get("email_message_id", "test"),
-            "has_attachment": scenario["input"]["has_attachment"],
-            "pdf_bytes": pdf_bytes,
-            "actions_log": [],
-            "trajectory": [],
-        }
+            future = pdf_cache.get(pdf_fixture)
+            if future is None:
+                # Not prefetched: read once and share the bytes with later scenarios
+                future = pdf_cache[pdf_fixture] = Future()
+                future.set_result(_read_fixture(FIXTURES_DIR / pdf_fixture))
+            pdf_bytes = future.result()
+
+        # Build workflow input state from the shared template. Lists are created
+        # per call so scenarios never share mutable state through the copy.
+        scenario_input = scenario["input"]
+        input_state = _INPUT_STATE_TEMPLATE.copy()
+        for key in _REQUIRED_INPUT_KEYS:
+            input_state[key] = scenario_input[key]
+        if "email_message_id" in scenario_input:
+            input_state["email_message_id"] = scenario_input["email_message_id"]
+        input_state["pdf_bytes"] = pdf_bytes
+        input_state["actions_log"] = []
+        input_state["trajectory"] = []
 
         # Run workflow
         result = workflow.invoke(input_state)
+        result_get = result.get
 
         # Extract email body from mock for email quality grading
         emails = mock_tools.emails_sent
         email_body = emails[0]["body"] if emails else None
 
         # Return dict matching what graders expect
+        expected = scenario["expected"]
         return {
-            "is_valid_po": result.get("is_valid_po", False),
-            "extracted_data": result.get("extracted_data"),
-            "trajectory": result.get("trajectory", []),
-            "missing_fields": result.get("missing_fields", []),
-            "final_status": result.get("final_status", "error"),
+            "is_valid_po": result_get("is_valid_po", False),
+            "extracted_data": result_get("extracted_data"),
+            "trajectory": result_get("trajectory", []),
+            "missing_fields": result_get("missing_fields", []),
+            "final_status": result_get("final_status", "error"),
             "email_body": email_body,
             # Pass through expected values for graders
-            "expected_is_valid_po": scenario["expected"]["is_valid_po"],
-            "expected_extracted_data": scenario["expected"].get("extracted_data"),
-            "expected_trajectory": scenario["expected"]["expected_trajectory"],
-            "expected_missing_fields": scenario["expected"].get("missing_fields", []),
+            "expected_is_valid_po": expected["is_valid_po"],
+            "expected_extracted_data": expected.get("extracted_data"),
+            "expected_trajectory": expected["expected_trajectory"],
+            "expected_missing_fields": expected.get("missing_fields", []),
         }
 
     return eval_task
@@ -124,23 +164,25 @@ def main():
     dataset.insert(dataset_items)
 
     # Run evaluation (task_threads=1 because tasks share mutable mock_tools state)
-    evaluate(
-        dataset=dataset,
-        task=build_eval_task(workflow, mock_tools),
-        scoring_metrics=[
-            ClassificationAccuracy(),
-            ExtractionAccuracy(),
-            TrajectoryCorrectness(),
-            ValidationCorrectness(),
-            EmailQuality(),
-        ],
-        experiment_name=args.experiment_name or "po-workflow-eval",
-        experiment_config={
-            "llm_model": config.llm_model,
-            "category": args.category or "all",
-        },
-        task_threads=1,
-    )
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pdf_cache = prefetch_pdf_fixtures(scenarios, pool)
+        evaluate(
+            dataset=dataset,
+            task=build_eval_task(workflow, mock_tools, pdf_cache),
+            scoring_metrics=[
+                ClassificationAccuracy(),
+                ExtractionAccuracy(),
+                TrajectoryCorrectness(),
+                ValidationCorrectness(),
+                EmailQuality(),
+            ],
+            experiment_name=args.experiment_name or "po-workflow-eval",
+            experiment_config={
+                "llm_model": config.llm_model,
+                "category": args.category or "all",
+            },
+            task_threads=1,
+        )
 
 
 if __name__ == "__main__":
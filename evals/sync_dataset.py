@@ -1,31 +1,78 @@
-"""Sync local JSON scenarios to Opik dataset."""
-import json
+"""Sync local JSON scenarios to Opik dataset.
+
+Each dataset's content digest is recorded in ``.opik_sync_cache.json`` so
+unchanged datasets are skipped on later runs.
+"""
+import hashlib
+import os
+from collections import defaultdict
 from pathlib import Path
+
+import orjson
 from opik import Opik
 
 SCENARIOS_DIR = Path("evals/scenarios")
+SYNC_CACHE_PATH = Path("evals/.opik_sync_cache.json")
+
+
+def _digest(scenarios: list[dict]) -> str:
+    return hashlib.blake2b(orjson.dumps(scenarios, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _load_sync_cache() -> dict[str, str]:
+    try:
+        with open(SYNC_CACHE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return {}
+
+
+def _save_sync_cache(cache: dict[str, str]) -> None:
+    with open(SYNC_CACHE_PATH, "wb") as f:
+        f.write(orjson.dumps(cache, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2))
+
+
+def _sync_dataset(client: Opik, cache: dict[str, str], name: str, scenarios: list[dict]) -> bool:
+    """Insert scenarios into the named dataset unless they match the last sync."""
+    digest = _digest(scenarios)
+    if cache.get(name) == digest:
+        return False
+    client.get_or_create_dataset(name).insert(scenarios)
+    cache[name] = digest
+    return True
 
 
 def sync():
     client = Opik()
+    cache = _load_sync_cache()
     all_scenarios = []
+    by_category: defaultdict[str, list[dict]] = defaultdict(list)
+
+    with os.scandir(SCENARIOS_DIR) as it:
+        paths = sorted(e.path for e in it if e.name.endswith(".json"))
+
+    for path in paths:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+        for scenario in data["scenarios"]:
+            all_scenarios.append(scenario)
+            by_category[scenario["category"]].append(scenario)
+
+    try:
+        if _sync_dataset(client, cache, "po-scenarios-all", all_scenarios):
+            print(f"Synced {len(all_scenarios)} scenarios to Opik dataset 'po-scenarios-all'")
+        else:
+            print("Opik dataset 'po-scenarios-all' is up to date")
 
-    for path in SCENARIOS_DIR.glob("*.json"):
-        with open(path) as f:
-            data = json.load(f)
-        all_scenarios.extend(data["scenarios"])
-
-    dataset = client.get_or_create_dataset("po-scenarios-all")
-    dataset.insert(all_scenarios)
-    print(f"Synced {len(all_scenarios)} scenarios to Opik dataset 'po-scenarios-all'")
-
-    # Also create per-category datasets
-    categories = set(s["category"] for s in all_scenarios)
-    for cat in categories:
-        cat_scenarios = [s for s in all_scenarios if s["category"] == cat]
-        ds = client.get_or_create_dataset(f"po-scenarios-{cat}")
-        ds.insert(cat_scenarios)
-        print(f"  Synced {len(cat_scenarios)} scenarios to 'po-scenarios-{cat}'")
+        # Also create per-category datasets
+        for cat, cat_scenarios in by_category.items():
+            name = f"po-scenarios-{cat}"
+            if _sync_dataset(client, cache, name, cat_scenarios):
+                print(f"  Synced {len(cat_scenarios)} scenarios to '{name}'")
+            else:
+                print(f"  '{name}' is up to date")
+    finally:
+        _save_sync_cache(cache)
 
 
 if __name__ == "__main__":
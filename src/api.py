@@ -1,20 +1,31 @@
+import asyncio
 import base64
-import hashlib
+import contextvars
 import hmac
-import json
 import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, BackgroundTasks, Request, HTTPException
 import opik
+from pydantic import ValidationError
 
 from src.config import AppConfig
 from src.builder import WorkflowBuilder
-from src.core.webhook import ComposioWebhookPayload, parse_composio_webhook, _extract_email
+from src.core.webhook import (
+    ComposioWebhookPayload,
+    _extract_email,
+    is_obviously_not_po,
+    parse_composio_webhook,
+)
 
 logger = logging.getLogger("po_agent.webhook")
 
+_WARMUP_PAYLOAD = b'{"data": {"message_id": "warmup", "attachment_list": [{"attachmentId": "a"}]}}'
 
-def _verify_signature(body: bytes, secret: str, headers: dict[str, str]) -> None:
+
+def _verify_signature(body: bytes, secret: bytes, headers: Mapping[str, str]) -> None:
     """Verify Composio webhook signature. Raises HTTPException(401) on failure."""
     webhook_id = headers.get("webhook-id", "")
     timestamp = headers.get("webhook-timestamp", "")
@@ -23,10 +34,8 @@ def _verify_signature(body: bytes, secret: str, headers: dict[str, str]) -> None
     if not webhook_id or not timestamp or not signature_header:
         raise HTTPException(status_code=401, detail="Missing webhook signature headers")
 
-    to_sign = f"{webhook_id}.{timestamp}.{body.decode()}"
-    expected = base64.b64encode(
-        hmac.new(secret.encode(), to_sign.encode(), hashlib.sha256).digest()
-    ).decode()
+    to_sign = b".".join((webhook_id.encode(), timestamp.encode(), body))
+    expected = base64.b64encode(hmac.digest(secret, to_sign, "sha256")).decode()
 
     # signature_header format: "v1,<base64_signature>"
     parts = signature_header.split(",", 1)
@@ -46,10 +55,34 @@ def create_app(config: AppConfig | None = None) -> FastAPI:
     builder = WorkflowBuilder(config)
     workflow = builder.build()
     tool_manager = builder.tool_manager
-    webhook_secret = config.composio_webhook_secret
+    # Encoded once here rather than on every request
+    webhook_secret = config.composio_webhook_secret.encode() if config.composio_webhook_secret else None
     seen_message_ids: set[str] = set()
 
-    app = FastAPI(title="PO Agent")
+    # Workflows run on a dedicated pool. Each dispatched workflow holds a slot
+    # while it is queued or running, so at most 2x the pool size are in flight;
+    # when all slots are taken new webhooks get a 503 and the sender retries.
+    workflow_pool = ThreadPoolExecutor(
+        max_workers=config.workflow_concurrency, thread_name_prefix="po-workflow"
+    )
+    workflow_slots = asyncio.Semaphore(config.workflow_concurrency * 2)
+    shutting_down = asyncio.Event()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Warm pydantic's first-call validation paths so the first webhook after a
+        # restart doesn't pay for them; purely an optimization, so never fatal
+        try:
+            ComposioWebhookPayload.model_validate_json(_WARMUP_PAYLOAD)
+        except ValidationError as e:
+            logger.warning("Webhook payload warmup failed: %s", e)
+        yield
+        # Stop dispatching, then let workflows already on the pool finish
+        # without blocking the event loop
+        shutting_down.set()
+        await asyncio.to_thread(workflow_pool.shutdown, True)
+
+    app = FastAPI(title="PO Agent", lifespan=lifespan)
 
     @opik.track(name="po_workflow")
     def process_email(payload: ComposioWebhookPayload):
@@ -62,12 +95,20 @@ def create_app(config: AppConfig | None = None) -> FastAPI:
                 message_id=webhook_data.message_id,
             )
         except Exception as e:
-            logger.warning(f"Failed to fetch full message {webhook_data.message_id}: {e}")
+            logger.warning("Failed to fetch full message %s: %s", webhook_data.message_id, e)
             full_message = {}
         email_body = full_message.get("messageText", webhook_data.body)
         email_subject = full_message.get("subject", webhook_data.subject)
         email_sender = _extract_email(full_message.get("sender", webhook_data.sender))
 
+        # Skip junk (no attachment, short body, no PO reference) before the attachment
+        # fetch and the workflow; judged on the full message only, never the snippet
+        if full_message and is_obviously_not_po(
+            webhook_data.model_copy(update={"subject": email_subject, "body": email_body})
+        ):
+            logger.info("Skipping non-PO email: message_id=%s", webhook_data.message_id)
+            return {"final_status": "skipped", "is_valid_po": False}
+
         # Fetch PDF attachment if present
         pdf_bytes = None
         if webhook_data.has_attachment:
@@ -78,7 +119,7 @@ def create_app(config: AppConfig | None = None) -> FastAPI:
                     file_name=webhook_data.attachment_filenames[0],
                 )
             except Exception as e:
-                logger.warning(f"Failed to fetch attachment from {webhook_data.message_id}: {e}")
+                logger.warning("Failed to fetch attachment from %s: %s", webhook_data.message_id, e)
 
         # Build workflow input state
         input_state = {
@@ -94,44 +135,70 @@ def create_app(config: AppConfig | None = None) -> FastAPI:
         }
 
         result = workflow.invoke(input_state)
-        logger.info(f"Workflow completed: status={result.get('final_status')}, po_id={result.get('po_id')}")
+        logger.info(
+            "Workflow completed: status=%s, po_id=%s", result.get("final_status"), result.get("po_id")
+        )
         return result
 
+    async def dispatch_workflow(payload: ComposioWebhookPayload):
+        """Run process_email on the workflow pool while holding a workflow slot."""
+        async with workflow_slots:
+            if shutting_down.is_set():
+                # Pool is closing; dedup state is in-memory, so a retry after restart is processed
+                logger.warning("Shutting down, dropping workflow: message_id=%s", payload.data.message_id)
+                return
+            # run_in_executor does not carry contextvars; copy them so Opik spans keep their trace
+            ctx = contextvars.copy_context()
+            await asyncio.get_running_loop().run_in_executor(workflow_pool, ctx.run, process_email, payload)
+
     @app.post("/webhook/email", status_code=202)
-    async def handle_email_webhook(request: Request, background_tasks: BackgroundTasks):
+    async def handle_email_webhook(request: Request, background_tasks: BackgroundTasks) -> dict[str, str]:
         """Receive Composio Gmail trigger webhook. Returns immediately, processes in background."""
         body = await request.body()
 
         # Verify signature if secret is configured
         if webhook_secret:
-            _verify_signature(body, webhook_secret, dict(request.headers))
+            _verify_signature(body, webhook_secret, request.headers)
 
         # Parse and validate payload
         try:
-            raw = json.loads(body)
-            payload = ComposioWebhookPayload(**raw)
-        except (json.JSONDecodeError, Exception) as e:
-            logger.error(f"Webhook payload validation failed: {e}")
+            payload = ComposioWebhookPayload.model_validate_json(body)
+        except Exception as e:
+            logger.error("Webhook payload validation failed: %s", e)
             raise HTTPException(status_code=422, detail=str(e))
 
         message_id = payload.data.message_id
 
         # Deduplicate — Composio may send the same webhook multiple times
         if message_id in seen_message_ids:
-            logger.info(f"Webhook duplicate, skipping: message_id={message_id}")
+            logger.info("Webhook duplicate, skipping: message_id=%s", message_id)
             return {"status": "duplicate", "message_id": message_id}
 
+        # Refuse before marking the id as seen, so the sender's retry is processed
+        if shutting_down.is_set() or workflow_slots.locked():
+            logger.warning("Workflow queue full, rejecting: message_id=%s", message_id)
+            raise HTTPException(status_code=503, detail="Too many workflows in progress", headers={"Retry-After": "5"})
+
         seen_message_ids.add(message_id)
-        logger.info(f"Webhook received: message_id={message_id}")
-        background_tasks.add_task(process_email, payload)
+        logger.info("Webhook received: message_id=%s", message_id)
+        background_tasks.add_task(dispatch_workflow, payload)
         return {"status": "accepted", "message_id": message_id}
 
     @app.get("/health")
-    async def health():
+    async def health() -> dict[str, str]:
         return {"status": "ok"}
 
     return app
 
 
-# Module-level app instance for uvicorn (CMD: uvicorn src.api:app)
-app = create_app()
+def __getattr__(name: str):
+    """Build the module-level app lazily on first access (CMD: uvicorn src.api:app).
+
+    Importing this module (e.g. for create_app in tests) no longer compiles a
+    workflow and opens service clients as a side effect.
+    """
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,13 @@
 """WorkflowBuilder: wires services and nodes based on AppConfig."""
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
 from src.config import AppConfig
 from src.services.ocr.base import OCRService
 from src.services.ocr.tesseract import TesseractOCR
+from src.services.ocr.prefetch import PrefetchingOCR
 from src.services.llm.base import LLMService
 from src.services.llm.openai import OpenAILLM
 from src.services.tools.base import ToolManager
@@ -16,9 +22,42 @@ from src.nodes.notify import NotifyNode
 from src.nodes.report import ReportNode
 from src.workflow import build_graph
 
+_SERVICE_CACHE_MAXSIZE = 16
+
+_SharedService = OCRService | LLMService | ToolManager
+
+# Services shared across builders with the same settings, least recently used first
+_service_cache: OrderedDict[tuple, _SharedService] = OrderedDict()
+_service_cache_lock = threading.Lock()
+
+
+def _secret_digest(secret: str | None) -> str | None:
+    """Cache-key form of a credential, so raw API keys are never held as keys."""
+    return hashlib.sha256(secret.encode()).hexdigest() if secret else None
+
+
+def _cached_service(key: tuple, factory: Callable[[], _SharedService]) -> _SharedService:
+    with _service_cache_lock:
+        if key in _service_cache:
+            _service_cache.move_to_end(key)
+            return _service_cache[key]
+    service = factory()
+    with _service_cache_lock:
+        service = _service_cache.setdefault(key, service)
+        _service_cache.move_to_end(key)
+        while len(_service_cache) > _SERVICE_CACHE_MAXSIZE:
+            _service_cache.popitem(last=False)
+    return service
+
 
 class WorkflowBuilder:
-    """Builds the PO workflow graph by wiring services and nodes from config."""
+    """Builds the PO workflow graph by wiring services and nodes from config.
+
+    OCR and LLM services and the Composio tool manager are shared across
+    builders with the same settings (avoids re-creating HTTP clients per build).
+    MockToolManager and prompt stores are always built fresh: the mock captures
+    calls per builder.
+    """
 
     def __init__(self, config: AppConfig):
         self.config = config
@@ -28,6 +67,7 @@ class WorkflowBuilder:
         self._llm = self._build_llm()
         self._tool_manager = self._build_tool_manager()
         self._prompt_store = self._build_prompt_store()
+        self._graph = None
 
     @property
     def tool_manager(self) -> ToolManager:
@@ -38,42 +78,65 @@ class WorkflowBuilder:
         return self._prompt_store
 
     def build(self):
-        """Build and return a compiled LangGraph workflow."""
+        """Build and return a compiled LangGraph workflow.
+
+        The graph is compiled once per builder; later calls return the same
+        compiled object since its nodes are bound to this builder's services.
+        """
+        if self._graph is not None:
+            return self._graph
+        prefetch = PrefetchingOCR(self._ocr) if self.config.speculative_ocr else None
+        ocr = prefetch or self._ocr
         nodes = {
-            "classify": ClassifyNode(llm=self._llm, prompt_store=self._prompt_store),
-            "extract": ExtractNode(ocr=self._ocr, llm=self._llm, prompt_store=self._prompt_store),
+            "classify": ClassifyNode(llm=self._llm, prompt_store=self._prompt_store, ocr_prefetch=prefetch),
+            "extract": ExtractNode(ocr=ocr, llm=self._llm, prompt_store=self._prompt_store),
             "validate": ValidateNode(self.config.confidence_threshold),
             "track": TrackNode(tools=self._tool_manager, spreadsheet_id=self.config.spreadsheet_id),
             "notify": NotifyNode(llm=self._llm, tools=self._tool_manager, prompt_store=self._prompt_store),
             "report": ReportNode(),
         }
-        return build_graph(nodes)
+        self._graph = build_graph(nodes)
+        return self._graph
+
+    @staticmethod
+    def clear_service_cache() -> None:
+        """Drop shared service instances (e.g. between tests that patch their clients)."""
+        with _service_cache_lock:
+            _service_cache.clear()
 
     def _build_ocr(self) -> OCRService:
         if self.config.ocr_engine == "tesseract":
-            return TesseractOCR()
+            return _cached_service(
+                ("ocr", "tesseract", self.config.ocr_workers),
+                lambda: TesseractOCR(workers=self.config.ocr_workers),
+            )
         raise ValueError(f"Unknown OCR engine: {self.config.ocr_engine}")
 
     def _build_llm(self) -> LLMService:
         if self.config.llm_provider == "openai":
-            return OpenAILLM(
+            key = ("llm", "openai", self.config.llm_model, _secret_digest(self.config.openai_api_key),
+                   self.config.llm_base_url)
+            return _cached_service(key, lambda: OpenAILLM(
                 model=self.config.llm_model,
                 api_key=self.config.openai_api_key,
                 base_url=self.config.llm_base_url,
-            )
+            ))
         raise ValueError(f"Unknown LLM provider: {self.config.llm_provider}")
 
     def _build_tool_manager(self) -> ToolManager:
         if self.config.tool_manager == "mock":
             return MockToolManager()
         if self.config.tool_manager == "composio":
+            key = ("tools", "composio", _secret_digest(self.config.composio_api_key),
+                   self.config.composio_user_id, tuple(sorted(self.config.composio_toolkit_versions.items())),
+                   self.config.sheet_name)
             from src.services.tools.composio import ComposioToolManager
-            return ComposioToolManager(
+            return _cached_service(key, lambda: ComposioToolManager(
                 api_key=self.config.composio_api_key,
                 user_id=self.config.composio_user_id,
                 toolkit_versions=self.config.composio_toolkit_versions,
                 sheet_name=self.config.sheet_name,
-            )
+            ))
         raise ValueError(f"Unknown tool manager: {self.config.tool_manager}")
 
     def _build_prompt_store(self) -> PromptStore:
@@ -3,12 +3,16 @@ from pathlib import Path
 import yaml
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# libyaml-backed loader when PyYAML was built with it; pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AppConfig(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # LLM
@@ -19,6 +23,8 @@ class AppConfig(BaseSettings):
 
     # OCR
     ocr_engine: str = "tesseract"
+    ocr_workers: int | None = None  # pages OCR'd in parallel; None = CPU count
+    speculative_ocr: bool = False  # start OCR while classifying; costs a wasted OCR run per non-PO PDF
 
     # Tools
     tool_manager: str = "composio"  # "composio" | "mock"
@@ -47,10 +53,13 @@ class AppConfig(BaseSettings):
     # Webhook verification
     composio_webhook_secret: str | None = None
 
+    # Webhook processing: max workflows running at once
+    workflow_concurrency: int = 4
+
     @classmethod
     def from_yaml(cls, path: str | Path) -> "AppConfig":
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         return cls(**data)
 
     @classmethod
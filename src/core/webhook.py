@@ -1,3 +1,5 @@
+import functools
+import re
 from email.utils import parseaddr
 
 from pydantic import BaseModel
@@ -50,23 +52,56 @@ class ComposioWebhookPayload(BaseModel):
     data: ComposioGmailData
 
 
+@functools.lru_cache(maxsize=4096)
 def _extract_email(sender: str) -> str:
-    """Extract plain email from '"Display Name" <email>' format."""
+    """Extract plain email from '"Display Name" <email>' format.
+
+    Cached: the same customer contacts send many POs, and parseaddr is slow.
+    """
     _, email = parseaddr(sender)
     return email if email else sender
 
 
 def parse_composio_webhook(payload: ComposioWebhookPayload) -> WebhookPayload:
-    """Convert a validated Composio webhook payload into our domain model."""
+    """Convert a validated Composio webhook payload into our domain model.
+
+    Every field comes from an already-validated payload, so the result is
+    built with model_construct to skip a second validation pass.
+    """
     data = payload.data
-    attachments = data.attachment_list
-    return WebhookPayload(
+    attachment_ids, attachment_filenames = [], []
+    for a in data.attachment_list:
+        attachment_ids.append(a.attachmentId)
+        attachment_filenames.append(a.filename or "attachment")
+    return WebhookPayload.model_construct(
         message_id=data.message_id,
         subject=data.subject,
         body=data.message_text,
         sender=_extract_email(data.sender),
-        has_attachment=len(attachments) > 0,
-        attachment_ids=[a.attachmentId for a in attachments],
-        attachment_filenames=[a.filename or "attachment" for a in attachments],
+        has_attachment=bool(attachment_ids),
+        attachment_ids=attachment_ids,
+        attachment_filenames=attachment_filenames,
         thread_id=data.thread_id,
     )
+
+
+# "PO-123", "PO 123", "P.O. #4512", "PO no. 7" or the words "purchase order"
+_PO_REFERENCE_RE = re.compile(
+    r"\bP\.?\s?O\.?\s*(?:#|no\.?|number)?\s*[-:]?\s*\d+|\bpurchase\s+orders?\b",
+    re.IGNORECASE,
+)
+_SHORT_BODY_CHARS = 200
+
+
+def is_obviously_not_po(webhook_data: WebhookPayload) -> bool:
+    """Cheap pre-filter: no attachment at all, a short body and no PO reference.
+
+    Pass the full message: webhook snippets may be truncated. Such emails can
+    skip the workflow entirely. Any attachment keeps the email, since mime
+    types and filenames are unreliable.
+    """
+    if webhook_data.has_attachment or len(webhook_data.body) >= _SHORT_BODY_CHARS:
+        return False
+    return not (
+        _PO_REFERENCE_RE.search(webhook_data.subject) or _PO_REFERENCE_RE.search(webhook_data.body)
+    )
@@ -1,4 +1,5 @@
-from typing import TypedDict
+import operator
+from typing import Annotated, TypedDict
 
 
 class POWorkflowState(TypedDict, total=False):
@@ -32,7 +33,8 @@ class POWorkflowState(TypedDict, total=False):
     confirmation_email_sent: bool
     missing_info_email_sent: bool
     actions_log: list[str]
-    trajectory: list[str]  # node names visited
+    # Node names visited. Nodes return only their own name; the reducer appends.
+    trajectory: Annotated[list[str], operator.add]
 
     # --- Error handling ---
     error_message: str | None
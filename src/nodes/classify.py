@@ -1,8 +1,11 @@
+import functools
+
 import opik
 
 from src.nodes.base import BaseNode
 from src.services.llm.base import LLMService
 from src.services.prompt_store.base import PromptStore
+from src.services.ocr.prefetch import PrefetchingOCR
 from src.core.workflow_state import POWorkflowState
 from src.core.llm_responses import ClassificationResult
 
@@ -10,17 +13,27 @@ from src.core.llm_responses import ClassificationResult
 class ClassifyNode(BaseNode):
     name = "classify"
 
-    def __init__(self, llm: LLMService, prompt_store: PromptStore):
+    def __init__(self, llm: LLMService, prompt_store: PromptStore, ocr_prefetch: PrefetchingOCR | None = None):
         self.llm = llm
         self.prompt_store = prompt_store
+        self.ocr_prefetch = ocr_prefetch
+
+    @functools.cached_property
+    def _system_message(self) -> dict:
+        # Static template: rendered on first use, then reused for every invocation
+        return {"role": "system", "content": self.prompt_store.get_and_render("classify", "system")}
 
     @opik.track(name="classify_node")
     def __call__(self, state: POWorkflowState) -> dict:
         if state.get("final_status") == "error":
-            return {"trajectory": state.get("trajectory", []) + ["classify"]}
+            return {"trajectory": ["classify"]}
 
+        pdf_bytes = state.get("pdf_bytes") if self.ocr_prefetch else None
         try:
-            system_prompt = self.prompt_store.get_and_render("classify", "system")
+            if pdf_bytes:
+                # Speculative: OCR runs while the LLM classifies; ExtractNode picks up the result
+                self.ocr_prefetch.prefetch(pdf_bytes)
+
             user_prompt = self.prompt_store.get_and_render("classify", "user", {
                 "subject": state.get("email_subject", ""),
                 "sender": state.get("email_sender", ""),
@@ -29,21 +42,25 @@ class ClassifyNode(BaseNode):
             })
 
             messages = [
-                {"role": "system", "content": system_prompt},
+                self._system_message,
                 {"role": "user", "content": user_prompt},
             ]
 
             result = self.llm.structured_output(messages, ClassificationResult)
+            if pdf_bytes and not result.is_valid_po:
+                self.ocr_prefetch.discard(pdf_bytes)
 
             return {
                 "is_valid_po": result.is_valid_po,
                 "po_id": result.po_id,
                 "classification_reason": result.reason,
-                "trajectory": state.get("trajectory", []) + ["classify"],
+                "trajectory": ["classify"],
             }
         except Exception as e:
+            if pdf_bytes:
+                self.ocr_prefetch.discard(pdf_bytes)
             return {
                 "final_status": "error",
                 "error_message": f"ClassifyNode failed: {e}",
-                "trajectory": state.get("trajectory", []) + ["classify"],
+                "trajectory": ["classify"],
             }
@@ -1,3 +1,5 @@
+import functools
+
 import opik
 
 from src.nodes.base import BaseNode
@@ -16,24 +18,25 @@ class ExtractNode(BaseNode):
         self.llm = llm
         self.prompt_store = prompt_store
 
+    @functools.cached_property
+    def _system_message(self) -> dict:
+        # Static template: rendered on first use, then reused for every invocation
+        return {"role": "system", "content": self.prompt_store.get_and_render("extract", "system")}
+
     @opik.track(name="extract_node")
     def __call__(self, state: POWorkflowState) -> dict:
-        if state.get("final_status") == "error":
-            return {"trajectory": state.get("trajectory", []) + ["extract"]}
-
-        if not state.get("is_valid_po"):
-            return {"trajectory": state.get("trajectory", []) + ["extract"]}
+        if state.get("final_status") == "error" or not state.get("is_valid_po"):
+            return {"trajectory": ["extract"]}
 
         try:
             raw_text = self.ocr.extract_text(state.get("pdf_bytes", b""))
 
-            system_prompt = self.prompt_store.get_and_render("extract", "system")
             user_prompt = self.prompt_store.get_and_render("extract", "user", {
                 "ocr_text": raw_text,
             })
 
             messages = [
-                {"role": "system", "content": system_prompt},
+                self._system_message,
                 {"role": "user", "content": user_prompt},
             ]
 
@@ -44,11 +47,11 @@ class ExtractNode(BaseNode):
                 "extracted_data": result.data.model_dump(),
                 "field_confidences": result.field_confidences.model_dump(),
                 "extraction_warnings": result.warnings,
-                "trajectory": state.get("trajectory", []) + ["extract"],
+                "trajectory": ["extract"],
             }
         except Exception as e:
             return {
                 "final_status": "error",
                 "error_message": f"ExtractNode failed: {e}",
-                "trajectory": state.get("trajectory", []) + ["extract"],
+                "trajectory": ["extract"],
             }
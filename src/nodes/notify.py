@@ -1,3 +1,5 @@
+import functools
+
 import opik
 
 from src.nodes.base import BaseNode
@@ -15,13 +17,15 @@ class NotifyNode(BaseNode):
         self.tools = tools
         self.prompt_store = prompt_store
 
+    @functools.cached_property
+    def _system_message(self) -> dict:
+        # Static template: rendered on first use, then reused for every invocation
+        return {"role": "system", "content": self.prompt_store.get_and_render("notify", "system")}
+
     @opik.track(name="notify_node")
     def __call__(self, state: POWorkflowState) -> dict:
-        if state.get("final_status") == "error":
-            return {"trajectory": state.get("trajectory", []) + ["notify"]}
-
-        if not state.get("is_valid_po"):
-            return {"trajectory": state.get("trajectory", []) + ["notify"]}
+        if state.get("final_status") == "error" or not state.get("is_valid_po"):
+            return {"trajectory": ["notify"]}
 
         try:
             extracted_data = state.get("extracted_data") or {}
@@ -29,8 +33,6 @@ class NotifyNode(BaseNode):
             po_id = state.get("po_id", "")
             email_sender = state.get("email_sender", "")
 
-            system_prompt = self.prompt_store.get_and_render("notify", "system")
-
             if missing_fields:
                 missing_desc = ", ".join(missing_fields)
                 user_prompt = self.prompt_store.get_and_render("notify", "missing_info", {
@@ -50,23 +52,19 @@ class NotifyNode(BaseNode):
                 subject = f"Order Confirmation: {po_id}"
 
             messages = [
-                {"role": "system", "content": system_prompt},
+                self._system_message,
                 {"role": "user", "content": user_prompt},
             ]
 
             email_body = self.llm.generate_text(messages)
             self.tools.send_email(to=email_sender, subject=subject, body=email_body)
 
-            result = {"trajectory": state.get("trajectory", []) + ["notify"]}
-            if missing_fields:
-                result["missing_info_email_sent"] = True
-            else:
-                result["confirmation_email_sent"] = True
-            return result
+            sent_key = "missing_info_email_sent" if missing_fields else "confirmation_email_sent"
+            return {sent_key: True, "trajectory": ["notify"]}
 
         except Exception as e:
             return {
                 "final_status": "error",
                 "error_message": f"NotifyNode failed: {e}",
-                "trajectory": state.get("trajectory", []) + ["notify"],
+                "trajectory": ["notify"],
             }
@@ -20,5 +20,5 @@ class ReportNode(BaseNode):
 
         return {
             "final_status": final_status,
-            "trajectory": state.get("trajectory", []) + ["report"],
+            "trajectory": ["report"],
         }
@@ -14,11 +14,8 @@ class TrackNode(BaseNode):
 
     @opik.track(name="track_node")
     def __call__(self, state: POWorkflowState) -> dict:
-        if state.get("final_status") == "error":
-            return {"trajectory": state.get("trajectory", []) + ["track"]}
-
-        if not state.get("is_valid_po"):
-            return {"trajectory": state.get("trajectory", []) + ["track"]}
+        if state.get("final_status") == "error" or not state.get("is_valid_po"):
+            return {"trajectory": ["track"]}
 
         try:
             extracted_data = state.get("extracted_data") or {}
@@ -40,11 +37,11 @@ class TrackNode(BaseNode):
 
             return {
                 "sheet_row_added": True,
-                "trajectory": state.get("trajectory", []) + ["track"],
+                "trajectory": ["track"],
             }
         except Exception as e:
             return {
                 "final_status": "error",
                 "error_message": f"TrackNode failed: {e}",
-                "trajectory": state.get("trajectory", []) + ["track"],
+                "trajectory": ["track"],
             }
@@ -3,10 +3,10 @@ import opik
 from src.nodes.base import BaseNode
 from src.core.workflow_state import POWorkflowState
 
-REQUIRED_FIELDS = [
+REQUIRED_FIELDS = (
     "order_id", "customer", "pickup_location", "delivery_location",
     "delivery_datetime", "driver_name", "driver_phone",
-]
+)
 
 
 class ValidateNode(BaseNode):
@@ -18,7 +18,7 @@ class ValidateNode(BaseNode):
     @opik.track(name="validate_node")
     def __call__(self, state: POWorkflowState) -> dict:
         if state.get("final_status") == "error":
-            return {"trajectory": state.get("trajectory", []) + ["validate"]}
+            return {"trajectory": ["validate"]}
 
         extracted_data = state.get("extracted_data") or {}
         field_confidences = state.get("field_confidences") or {}
@@ -40,5 +40,5 @@ class ValidateNode(BaseNode):
         return {
             "missing_fields": missing_fields,
             "validation_errors": validation_errors,
-            "trajectory": state.get("trajectory", []) + ["validate"],
+            "trajectory": ["validate"],
         }
@@ -1,15 +1,29 @@
+import functools
+
+import httpx
 import opik
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
 
 from src.services.llm.base import LLMService, T
 
+# A hung completion shouldn't hold a workflow worker for the SDK's 10-minute default
+_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+
+
+@functools.cache
+def _shared_http_client() -> httpx.Client:
+    """One connection pool for every OpenAILLM (keep-alive reused across models/instances)."""
+    return DefaultHttpxClient()
+
 
 class OpenAILLM(LLMService):
     """OpenAI-compatible LLM service with structured output support."""
 
     def __init__(self, model: str = "gpt-4o-mini", base_url: str | None = None, api_key: str | None = None):
         self._model = model
-        self._client = OpenAI(base_url=base_url, api_key=api_key)
+        self._client = OpenAI(
+            base_url=base_url, api_key=api_key, timeout=_TIMEOUT, http_client=_shared_http_client()
+        )
 
     @opik.track(name="llm_structured_output")
     def structured_output(self, messages: list[dict], response_model: type[T]) -> T:
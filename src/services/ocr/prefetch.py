@@ -0,0 +1,54 @@
+import contextvars
+import functools
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from src.services.ocr.base import OCRService
+
+
+@functools.cache
+def _shared_pool() -> ThreadPoolExecutor:
+    # One pool for every PrefetchingOCR, so rebuilding workflows doesn't leak threads
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="ocr-prefetch")
+
+
+def _content_key(pdf_bytes: bytes) -> bytes:
+    return hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+
+
+class PrefetchingOCR(OCRService):
+    """Wraps an OCRService so OCR can start before the text is needed.
+
+    `prefetch` starts OCR in the background (e.g. while the email is being
+    classified); a later `extract_text` on the same content waits for that
+    result instead of starting over. `discard` drops a prefetch whose result
+    will not be used; an OCR run that has already started still finishes.
+    """
+
+    def __init__(self, inner: OCRService):
+        self._inner = inner
+        # Keyed by a content hash, so a copy of the same PDF still finds its prefetch
+        self._pending: dict[bytes, Future] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, pdf_bytes: bytes) -> None:
+        key = _content_key(pdf_bytes)
+        with self._lock:
+            if key not in self._pending:
+                # Run under the caller's context so OCR spans nest in its trace
+                ctx = contextvars.copy_context()
+                self._pending[key] = _shared_pool().submit(ctx.run, self._inner.extract_text, pdf_bytes)
+
+    def discard(self, pdf_bytes: bytes) -> None:
+        with self._lock:
+            future = self._pending.pop(_content_key(pdf_bytes), None)
+        if future is not None:
+            future.cancel()
+
+    def extract_text(self, pdf_bytes: bytes) -> str:
+        with self._lock:
+            future = self._pending.pop(_content_key(pdf_bytes), None)
+        if future is not None:
+            return future.result()
+        return self._inner.extract_text(pdf_bytes)
@@ -1,3 +1,7 @@
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
 import opik
 import pytesseract
 from pdf2image import convert_from_bytes
@@ -5,22 +9,83 @@ from PIL import Image
 
 from src.services.ocr.base import OCRService
 
+# Below this many characters per page the text layer is treated as missing
+# (scanned PDF) and pages go through OCR instead.
+_MIN_TEXT_CHARS_PER_PAGE = 50
+
+# LSTM engine, single uniform text block: skips Tesseract's layout analysis
+_DEFAULT_TESSERACT_CONFIG = "--oem 1 --psm 6"
+
 
 class TesseractOCR(OCRService):
     """Tesseract OCR via image-based extraction.
 
-    PDF bytes → images (via pdf2image/poppler) → Tesseract OCR → concatenated text.
+    Digitally generated PDFs are read straight from their text layer with
+    poppler's pdftotext. Otherwise: PDF bytes → images (via pdf2image/poppler)
+    → Tesseract OCR → concatenated text. Pages are rasterized and recognized in parallel; each pytesseract call runs
+    the tesseract binary as a subprocess, so threads are enough to use all cores.
     """
 
-    def __init__(self, lang: str = "eng", dpi: int = 300):
+    def __init__(
+        self,
+        lang: str = "eng",
+        dpi: int = 200,
+        workers: int | None = None,
+        use_text_layer: bool = True,
+        tesseract_config: str = _DEFAULT_TESSERACT_CONFIG,
+    ):
         self._lang = lang
         self._dpi = dpi
+        self._tesseract_config = tesseract_config
+        self._use_text_layer = use_text_layer
+        self._workers = workers or os.cpu_count() or 1
+        self._pool: ThreadPoolExecutor | None = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        # Created on first multi-page PDF and reused; OCR instances are long-lived
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="ocr")
+        return self._pool
+
+    def _ocr_page(self, img: Image.Image) -> str:
+        return pytesseract.image_to_string(img, lang=self._lang, config=self._tesseract_config)
+
+    @staticmethod
+    def _extract_text_layer(pdf_bytes: bytes) -> str | None:
+        """Return the PDF's embedded text, or None if it has too little (or pdftotext fails)."""
+        try:
+            proc = subprocess.run(
+                ["pdftotext", "-layout", "-enc", "UTF-8", "-", "-"],
+                input=pdf_bytes,
+                capture_output=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if proc.returncode != 0:
+            return None
+
+        # pdftotext ends every page with a form feed
+        pages = proc.stdout.decode("utf-8", errors="replace").split("\f")
+        if len(pages) > 1 and not pages[-1].strip():
+            pages.pop()
+        text = "\n".join(pages).strip()
+        if len(text) < _MIN_TEXT_CHARS_PER_PAGE * len(pages):
+            return None
+        return text
 
     @opik.track(name="ocr_extract_text")
     def extract_text(self, pdf_bytes: bytes) -> str:
-        images: list[Image.Image] = convert_from_bytes(pdf_bytes, dpi=self._dpi)
-        texts = []
-        for img in images:
-            text = pytesseract.image_to_string(img, lang=self._lang)
-            texts.append(text)
+        if self._use_text_layer:
+            text = self._extract_text_layer(pdf_bytes)
+            if text is not None:
+                return text
+
+        images: list[Image.Image] = convert_from_bytes(
+            pdf_bytes, dpi=self._dpi, grayscale=True, thread_count=self._workers
+        )
+        if len(images) <= 1 or self._workers == 1:
+            texts = [self._ocr_page(img) for img in images]
+        else:
+            texts = list(self._get_pool().map(self._ocr_page, images))
         return "\n".join(texts).strip()
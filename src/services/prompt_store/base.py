@@ -1,15 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
-from pydantic import BaseModel, Field
+from string import Formatter
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class PromptTemplate(BaseModel):
     """A single prompt template with its metadata."""
+    # Frozen so the parsed parts below can't go stale if the template is reassigned
+    model_config = ConfigDict(frozen=True)
+
     name: str
     template: str
     description: str = ""
     params: list[str] = Field(default_factory=list)
 
+    # (literal, field) pairs parsed once; None when the template needs full str.format
+    _parts: tuple[tuple[str, str | None], ...] | None = PrivateAttr(default=None)
+    _params_set: frozenset[str] = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._params_set = frozenset(self.params)
+        try:
+            parsed = list(Formatter().parse(self.template))
+        except ValueError:
+            return  # malformed template: let str.format raise at render time
+        if all(f is None or (f.isidentifier() and not spec and not conv) for _, f, spec, conv in parsed):
+            self._parts = tuple((literal, field) for literal, field, _, _ in parsed)
+
 
 class PromptStore(ABC):
     """Abstract interface for prompt template storage.
@@ -38,7 +55,7 @@ class PromptStore(ABC):
         ...
 
     @abstractmethod
-    def get(self, category: str, name: str) -> Optional[PromptTemplate]:
+    def get(self, category: str, name: str) -> PromptTemplate | None:
         """Get a prompt template by category and name.
 
         Args:
@@ -76,17 +93,22 @@ class PromptStore(ABC):
         Raises:
             ValueError: If required parameters are missing
         """
-        missing = [p for p in template.params if p not in params]
-        if missing:
+        if not params.keys() >= template._params_set:
+            missing = [p for p in template.params if p not in params]
             raise ValueError(
                 f"Missing required parameters for template '{template.name}': {missing}"
             )
         if not template.params:
             return template.template
-        return template.template.format(**params)
+        if template._parts is None:
+            return template.template.format(**params)
+        return "".join(
+            literal if field is None else literal + format(params[field])
+            for literal, field in template._parts
+        )
 
     def get_and_render(
-        self, category: str, name: str, params: Optional[dict[str, Any]] = None
+        self, category: str, name: str, params: dict[str, Any] | None = None
     ) -> str:
         """Get a template and render it in one call.
 
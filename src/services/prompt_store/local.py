@@ -1,8 +1,11 @@
+import os
+
 import yaml
 from pathlib import Path
-from typing import Optional
 from src.services.prompt_store.base import PromptStore, PromptTemplate
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class LocalPromptStore(PromptStore):
     """Loads prompts from local YAML files organized by language.
@@ -31,17 +34,44 @@ class LocalPromptStore(PromptStore):
             params:
                 - subject
                 - body
+
+    All category files for the active and fallback languages are read once at
+    construction and resolved into one (category, name) index with the
+    language fallback already applied, so `get` is a single dict lookup.
     """
 
     def __init__(self, prompts_dir: str | Path, language: str = "en", fallback_language: str = "en"):
         self._base_dir = Path(prompts_dir)
         self._language = language
         self._fallback_language = fallback_language
-        self._cache: dict[str, dict] = {}
+        self._templates: dict[tuple[str, str], PromptTemplate] = {}
+        self._prompt_names: dict[str, list[str]] = {}
 
         if not self._base_dir.exists():
             raise FileNotFoundError(f"Prompts directory not found: {self._base_dir}")
 
+        # One directory snapshot per language: lang -> category stems
+        self._available: dict[str, set[str]] = {
+            lang: self._scan_language(lang) for lang in dict.fromkeys([language, fallback_language])
+        }
+
+        # Languages in priority order: the first one defining a prompt wins
+        for lang, lang_categories in self._available.items():
+            for category in sorted(lang_categories):
+                data = self._load_category(category, lang)
+                if not data:
+                    continue
+                self._prompt_names.setdefault(category, list(data))
+                for name, entry in data.items():
+                    if (category, name) not in self._templates:
+                        self._templates[(category, name)] = PromptTemplate(
+                            name=f"{category}.{name}",
+                            template=entry["template"],
+                            description=entry.get("description", ""),
+                            params=entry.get("params", []),
+                        )
+        self._categories = sorted(set().union(*self._available.values()))
+
     @property
     def language(self) -> str:
         return self._language
@@ -50,47 +80,24 @@ class LocalPromptStore(PromptStore):
     def fallback_language(self) -> str:
         return self._fallback_language
 
-    def get(self, category: str, name: str) -> Optional[PromptTemplate]:
-        # Try current language first, then fallback
-        for lang in [self._language, self._fallback_language]:
-            data = self._load_category(category, lang)
-            if data and name in data:
-                entry = data[name]
-                return PromptTemplate(
-                    name=f"{category}.{name}",
-                    template=entry["template"],
-                    description=entry.get("description", ""),
-                    params=entry.get("params", []),
-                )
-        return None
+    def get(self, category: str, name: str) -> PromptTemplate | None:
+        return self._templates.get((category, name))
 
     def list_categories(self) -> list[str]:
-        categories = set()
-        for lang in [self._language, self._fallback_language]:
-            lang_dir = self._base_dir / lang
-            if lang_dir.exists():
-                for path in lang_dir.glob("*.yaml"):
-                    categories.add(path.stem)
-        return sorted(categories)
+        return list(self._categories)
 
     def list_prompts(self, category: str) -> list[str]:
-        for lang in [self._language, self._fallback_language]:
-            data = self._load_category(category, lang)
-            if data:
-                return list(data.keys())
-        return []
+        return list(self._prompt_names.get(category, ()))
 
-    def _load_category(self, category: str, lang: str) -> Optional[dict]:
-        cache_key = f"{lang}/{category}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+    def _scan_language(self, lang: str) -> set[str]:
+        try:
+            with os.scandir(self._base_dir / lang) as it:
+                return {e.name[:-5] for e in it if e.name.endswith(".yaml") and e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
 
+    def _load_category(self, category: str, lang: str) -> dict | None:
         path = self._base_dir / lang / f"{category}.yaml"
-        if not path.exists():
-            return None
-
-        with open(path) as f:
-            data = yaml.safe_load(f)
-
-        self._cache[cache_key] = data
-        return data
+        # Bytes in: libyaml detects the encoding itself, skipping Python-side decoding
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=_YamlLoader)
@@ -10,6 +10,8 @@ class MockToolManager(ToolManager):
         mock_message: dict | None = None,
     ):
         self._calls: list[dict] = []
+        # Per-action views, filled as calls are recorded
+        self._by_action: dict[str, list[dict]] = {}
         self._mock_attachment_bytes = mock_attachment_bytes
         self._mock_message = mock_message or {}
 
@@ -21,7 +23,7 @@ class MockToolManager(ToolManager):
             "body": body,
             "thread_id": thread_id,
         }
-        self._calls.append(call)
+        self._record(call)
         return {"status": "ok", "mock": True}
 
     def append_sheet_row(self, spreadsheet_id: str, values: list[str]) -> dict:
@@ -30,7 +32,7 @@ class MockToolManager(ToolManager):
             "spreadsheet_id": spreadsheet_id,
             "values": values,
         }
-        self._calls.append(call)
+        self._record(call)
         return {"status": "ok", "mock": True}
 
     def get_email_attachment(self, message_id: str, attachment_id: str, file_name: str = "attachment") -> bytes:
@@ -39,7 +41,7 @@ class MockToolManager(ToolManager):
             "message_id": message_id,
             "attachment_id": attachment_id,
         }
-        self._calls.append(call)
+        self._record(call)
         return self._mock_attachment_bytes
 
     def get_email_message(self, message_id: str) -> dict:
@@ -47,22 +49,40 @@ class MockToolManager(ToolManager):
             "action": "get_email_message",
             "message_id": message_id,
         }
-        self._calls.append(call)
+        self._record(call)
         return dict(self._mock_message)
 
+    def _record(self, call: dict) -> None:
+        self._calls.append(call)
+        self._by_action.setdefault(call["action"], []).append(call)
+
     # --- Inspection API for graders ---
 
     @property
     def emails_sent(self) -> list[dict]:
-        return [c for c in self._calls if c["action"] == "send_email"]
+        return list(self._by_action.get("send_email", ()))
 
     @property
     def sheet_rows_added(self) -> list[dict]:
-        return [c for c in self._calls if c["action"] == "append_sheet_row"]
+        return list(self._by_action.get("append_sheet_row", ()))
 
     @property
     def all_calls(self) -> list[dict]:
         return list(self._calls)
 
+    @property
+    def calls_by_action(self) -> dict[str, list[dict]]:
+        """Copy of the recorded calls grouped by action name (only actions that were called)."""
+        return {action: list(calls) for action, calls in self._by_action.items()}
+
+    def assert_called(self, action: str, **expected) -> dict:
+        """Assert some `action` call has all `expected` fields; returns the first match."""
+        calls = self._by_action.get(action, [])
+        for call in calls:
+            if all(call.get(k) == v for k, v in expected.items()):
+                return call
+        raise AssertionError(f"No {action} call matching {expected}; got {calls}")
+
     def reset(self):
         self._calls.clear()
+        self._by_action.clear()
@@ -6,9 +6,8 @@ from src.core.workflow_state import POWorkflowState
 
 def should_continue_after_classify(state: POWorkflowState) -> str:
     """Route after classification: continue processing or skip to report."""
-    if state.get("is_valid_po", False):
-        return "extract"
-    return "report"
+    # .get: classify's error path returns without setting is_valid_po
+    return "extract" if state.get("is_valid_po") else "report"
 
 
 def build_graph(nodes: dict):
@@ -1,4 +1,24 @@
 import os
 
+import pytest
+
 # Disable Opik tracing during tests to avoid sending data and needing API keys
 os.environ.setdefault("OPIK_TRACK_DISABLE", "true")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _clean_env():
+    """Keep a developer's real webhook secret from switching on signature checks in tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("COMPOSIO_WEBHOOK_SECRET", raising=False)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_builder_service_cache():
+    """Keep shared OCR/LLM instances (possibly built with patched clients) from leaking between tests."""
+    from src.builder import WorkflowBuilder
+
+    WorkflowBuilder.clear_service_cache()
+    yield
+    WorkflowBuilder.clear_service_cache()
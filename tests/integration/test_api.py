@@ -1,14 +1,21 @@
 """Integration tests for FastAPI webhook endpoint."""
+import asyncio
 import base64
-import hashlib
+import functools
 import hmac
-import json
+import threading
 import time
+from contextlib import asynccontextmanager
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from pydantic import ValidationError
 
+from src import api
 from src.api import create_app
 from src.config import AppConfig
 from src.services.tools.mock import MockToolManager
@@ -42,12 +49,34 @@ PAYLOAD_NO_ATTACHMENT = {
 
 TEST_WEBHOOK_SECRET = "whsec_test_secret_for_unit_tests"
 
+# Serialized once with orjson; tests post these exact bytes
+VALID_WEBHOOK_BODY = orjson.dumps(VALID_WEBHOOK_PAYLOAD)
+NO_ATTACHMENT_BODY = orjson.dumps(PAYLOAD_NO_ATTACHMENT)
+
+
+def _webhook_body(message_id: str) -> bytes:
+    """VALID_WEBHOOK_PAYLOAD under a different message id (dedup is per id)."""
+    return orjson.dumps({**VALID_WEBHOOK_PAYLOAD, "data": {**VALID_WEBHOOK_PAYLOAD["data"], "message_id": message_id}})
+
+
+# Fixed per session so _sign_payload's cache is hit (the API does not check timestamp age)
+_SIGNED_AT = str(int(time.time()))
+
+
+# One event loop for the module; apps and clients are still built per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+class StubWorkflow:
+    """Compiled-graph stand-in; only `invoke` is a mock, for call assertions."""
+
+    def __init__(self):
+        self.invoke = MagicMock(return_value={"final_status": "completed", "po_id": "PO-001"})
+
 
 @pytest.fixture
 def mock_workflow():
-    workflow = MagicMock()
-    workflow.invoke.return_value = {"final_status": "completed", "po_id": "PO-001"}
-    return workflow
+    return StubWorkflow()
 
 
 @pytest.fixture
@@ -61,45 +90,57 @@ def mock_tools():
     )
 
 
-@pytest.fixture
-def client(mock_workflow, mock_tools, monkeypatch):
-    """Client without webhook secret (no verification)."""
-    monkeypatch.delenv("COMPOSIO_WEBHOOK_SECRET", raising=False)
-    with patch("src.api.WorkflowBuilder") as mock_builder_cls:
-        mock_builder = MagicMock()
-        mock_builder_cls.return_value = mock_builder
-        mock_builder.build.return_value = mock_workflow
-        mock_builder.tool_manager = mock_tools
-        app = create_app(AppConfig(tool_manager="mock", composio_webhook_secret=None, _env_file=None))
-    return TestClient(app)
-
-
-@pytest.fixture
-def secure_client(mock_workflow, mock_tools, monkeypatch):
-    """Client with webhook secret (verification enabled)."""
-    monkeypatch.delenv("COMPOSIO_WEBHOOK_SECRET", raising=False)
-    with patch("src.api.WorkflowBuilder") as mock_builder_cls:
+def _make_app(mock_workflow, mock_tools, webhook_secret: str | None, **overrides) -> FastAPI:
+    with patch.object(api, "WorkflowBuilder") as mock_builder_cls:
         mock_builder = MagicMock()
         mock_builder_cls.return_value = mock_builder
         mock_builder.build.return_value = mock_workflow
         mock_builder.tool_manager = mock_tools
-        app = create_app(AppConfig(
+        return create_app(AppConfig(
             tool_manager="mock",
-            composio_webhook_secret=TEST_WEBHOOK_SECRET,
+            composio_webhook_secret=webhook_secret,
             _env_file=None,
+            **overrides,
         ))
-    return TestClient(app)
 
 
-def _sign_payload(payload_dict: dict, secret: str) -> dict:
+@asynccontextmanager
+async def _serve(app: FastAPI):
+    """Run the app's lifespan around an AsyncClient, so its workflow pool is shut down."""
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            yield ac
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(mock_workflow, mock_tools):
+    """Client without webhook secret (no verification)."""
+    async with _serve(_make_app(mock_workflow, mock_tools, None)) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def secure_client(mock_workflow, mock_tools):
+    """Client with webhook secret (verification enabled)."""
+    async with _serve(_make_app(mock_workflow, mock_tools, TEST_WEBHOOK_SECRET)) as ac:
+        yield ac
+
+
+@functools.lru_cache(maxsize=4)
+def _hmac_proto(secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state; copied per signature so key padding is done once."""
+    return hmac.new(secret.encode(), digestmod="sha256")
+
+
+@functools.lru_cache(maxsize=32)
+def _sign_payload(body: bytes, secret: str, timestamp: str | None = None) -> dict:
     """Generate Composio-style webhook signature headers (base64-encoded HMAC-SHA256)."""
-    body = json.dumps(payload_dict)
     msg_id = "msg_test123"
-    timestamp = str(int(time.time()))
-    to_sign = f"{msg_id}.{timestamp}.{body}"
-    signature = base64.b64encode(
-        hmac.new(secret.encode(), to_sign.encode(), hashlib.sha256).digest()
-    ).decode()
+    timestamp = timestamp or str(int(time.time()))
+    to_sign = b".".join((msg_id.encode(), timestamp.encode(), body))
+    mac = _hmac_proto(secret).copy()
+    mac.update(to_sign)
+    signature = base64.b64encode(mac.digest()).decode()
     return {
         "webhook-id": msg_id,
         "webhook-timestamp": timestamp,
@@ -107,108 +148,184 @@ def _sign_payload(payload_dict: dict, secret: str) -> dict:
     }
 
 
+def _json(response) -> dict:
+    return orjson.loads(response.content)
+
+
 class TestHealthEndpoint:
-    def test_returns_200(self, client):
-        response = client.get("/health")
+    async def test_returns_200(self, client):
+        response = await client.get("/health")
         assert response.status_code == 200
-        assert response.json() == {"status": "ok"}
+        assert _json(response) == {"status": "ok"}
+
+
+class TestLifespan:
+    async def test_failed_warmup_does_not_block_startup(self, mock_workflow, mock_tools, monkeypatch):
+        # Own app: leaving the lifespan shuts down its workflow pool
+        app = _make_app(mock_workflow, mock_tools, None)
+        schema_error = ValidationError.from_exception_data("ComposioWebhookPayload", [])
+        validate = MagicMock(side_effect=schema_error)
+        monkeypatch.setattr(api.ComposioWebhookPayload, "model_validate_json", validate)
+        async with app.router.lifespan_context(app):
+            pass
+        validate.assert_called_once()
+
+    async def test_rejects_webhooks_after_shutdown(self, mock_workflow, mock_tools):
+        app = _make_app(mock_workflow, mock_tools, None)
+        async with app.router.lifespan_context(app):
+            pass
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post("/webhook/email", content=VALID_WEBHOOK_BODY)
+        assert response.status_code == 503
+        mock_workflow.invoke.assert_not_called()
 
 
 class TestWebhookEndpoint:
-    def test_returns_202_with_message_id(self, client):
-        response = client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
+    async def test_returns_202_with_message_id(self, client):
+        response = await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
         assert response.status_code == 202
-        body = response.json()
+        body = _json(response)
         assert body["status"] == "accepted"
         assert body["message_id"] == "msg-123"
 
-    def test_invalid_payload_returns_422(self, client):
-        response = client.post("/webhook/email", json={"bad": "data"})
+    async def test_invalid_payload_returns_422(self, client):
+        response = await client.post("/webhook/email", content=b'{"bad": "data"}')
         assert response.status_code == 422
 
-    def test_missing_data_returns_422(self, client):
-        response = client.post("/webhook/email", json={})
+    async def test_missing_data_returns_422(self, client):
+        response = await client.post("/webhook/email", content=b"{}")
         assert response.status_code == 422
 
-    def test_duplicate_message_id_returns_duplicate(self, client):
+    async def test_duplicate_message_id_returns_duplicate(self, client):
         """Composio may send the same webhook multiple times; second should be deduped."""
-        first = client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
-        assert first.json()["status"] == "accepted"
+        first = await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
+        assert _json(first)["status"] == "accepted"
 
-        second = client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
+        second = await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
         assert second.status_code == 202
-        assert second.json()["status"] == "duplicate"
+        assert _json(second)["status"] == "duplicate"
+
+    async def test_concurrent_duplicates_accept_exactly_one(self, client):
+        responses = await asyncio.gather(
+            *(client.post("/webhook/email", content=VALID_WEBHOOK_BODY) for _ in range(5))
+        )
+        statuses = sorted(_json(r)["status"] for r in responses)
+        assert statuses == ["accepted"] + ["duplicate"] * 4
+
+    async def test_returns_503_when_workflow_slots_are_full(self, mock_tools):
+        release = threading.Event()
+
+        def blocked_invoke(state):
+            release.wait(5)
+            return {"final_status": "completed"}
+
+        workflow = StubWorkflow()
+        workflow.invoke.side_effect = blocked_invoke
+        # One worker, so two slots: one workflow running plus one queued
+        app = _make_app(workflow, mock_tools, None, workflow_concurrency=1)
+        async with _serve(app) as ac:
+            busy = [
+                asyncio.create_task(ac.post("/webhook/email", content=_webhook_body(f"msg-busy-{i}")))
+                for i in range(2)
+            ]
+            while not workflow.invoke.called:
+                await asyncio.sleep(0.01)
+            rejected = await ac.post("/webhook/email", content=_webhook_body("msg-late"))
+            release.set()
+            await asyncio.gather(*busy)
+            retried = await ac.post("/webhook/email", content=_webhook_body("msg-late"))
+
+        assert rejected.status_code == 503
+        # The rejected id was not marked as seen, so the retry is accepted
+        assert _json(retried)["status"] == "accepted"
 
 
 class TestWebhookVerification:
-    def test_no_secret_configured_skips_verification(self, client):
+    async def test_no_secret_configured_skips_verification(self, client):
         """When no secret is set, webhook accepts without signature headers."""
-        response = client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
+        response = await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
         assert response.status_code == 202
 
-    def test_missing_signature_returns_401(self, secure_client):
+    async def test_missing_signature_returns_401(self, secure_client):
         """When secret is set but request has no signature headers, reject."""
-        response = secure_client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
+        response = await secure_client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
         assert response.status_code == 401
 
-    def test_invalid_signature_returns_401(self, secure_client):
+    async def test_invalid_signature_returns_401(self, secure_client):
         """When signature doesn't match, reject."""
         headers = {
             "webhook-id": "msg_fake",
             "webhook-timestamp": str(int(time.time())),
-            "webhook-signature": "v1,invalidsignature",
+            # Well-formed (base64 of a 32-byte digest) so the full comparison runs
+            "webhook-signature": "v1," + base64.b64encode(bytes(32)).decode(),
         }
-        response = secure_client.post(
-            "/webhook/email", json=VALID_WEBHOOK_PAYLOAD, headers=headers
+        response = await secure_client.post(
+            "/webhook/email", content=VALID_WEBHOOK_BODY, headers=headers
         )
         assert response.status_code == 401
 
-    def test_valid_signature_passes(self, secure_client):
+    async def test_valid_signature_passes(self, secure_client):
         """When signature is valid, accept the webhook."""
-        headers = _sign_payload(VALID_WEBHOOK_PAYLOAD, TEST_WEBHOOK_SECRET)
-        response = secure_client.post(
+        headers = _sign_payload(VALID_WEBHOOK_BODY, TEST_WEBHOOK_SECRET, _SIGNED_AT)
+        response = await secure_client.post(
             "/webhook/email",
-            content=json.dumps(VALID_WEBHOOK_PAYLOAD),
+            content=VALID_WEBHOOK_BODY,
             headers={**headers, "content-type": "application/json"},
         )
         assert response.status_code == 202
 
 
 class TestProcessEmail:
-    def test_fetches_full_message(self, client, mock_tools):
-        client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
-        message_calls = [c for c in mock_tools.all_calls if c["action"] == "get_email_message"]
-        assert len(message_calls) == 1
-        assert message_calls[0]["message_id"] == "msg-123"
-
-    def test_fetches_attachment_when_present(self, client, mock_tools):
-        client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
-        att_calls = [c for c in mock_tools.all_calls if c["action"] == "get_email_attachment"]
-        assert len(att_calls) == 1
-        assert att_calls[0]["message_id"] == "msg-123"
-        assert att_calls[0]["attachment_id"] == "att-789"
-
-    def test_skips_attachment_when_none(self, client, mock_tools):
-        client.post("/webhook/email", json=PAYLOAD_NO_ATTACHMENT)
-        att_calls = [c for c in mock_tools.all_calls if c["action"] == "get_email_attachment"]
-        assert len(att_calls) == 0
-
-    def test_invokes_workflow(self, client, mock_workflow):
-        client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
+    async def test_fetches_full_message(self, client, mock_tools):
+        await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
+        assert len(mock_tools.calls_by_action["get_email_message"]) == 1
+        mock_tools.assert_called("get_email_message", message_id="msg-123")
+
+    async def test_fetches_attachment_when_present(self, client, mock_tools):
+        await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
+        assert len(mock_tools.calls_by_action["get_email_attachment"]) == 1
+        mock_tools.assert_called("get_email_attachment", message_id="msg-123", attachment_id="att-789")
+
+    async def test_skips_attachment_when_none(self, client, mock_tools):
+        await client.post("/webhook/email", content=NO_ATTACHMENT_BODY)
+        assert "get_email_attachment" not in mock_tools.calls_by_action
+
+    async def test_short_non_po_email_skips_workflow(self, mock_workflow):
+        tools = MockToolManager(mock_message={"messageText": "Lunch on Friday?", "subject": "Hi"})
+        async with _serve(_make_app(mock_workflow, tools, None)) as ac:
+            await ac.post("/webhook/email", content=NO_ATTACHMENT_BODY)
+        mock_workflow.invoke.assert_not_called()
+
+    async def test_truncated_snippet_is_judged_on_full_message(self, mock_workflow):
+        # Snippet has no PO reference; the full body fetched from Gmail does
+        tools = MockToolManager(mock_message={"messageText": "Just a question about PO-2024-001"})
+        async with _serve(_make_app(mock_workflow, tools, None)) as ac:
+            await ac.post("/webhook/email", content=NO_ATTACHMENT_BODY)
+        mock_workflow.invoke.assert_called_once()
+
+    async def test_unfetched_message_is_not_skipped(self, mock_workflow):
+        tools = MockToolManager()
+        with patch.object(tools, "get_email_message", side_effect=RuntimeError("gmail down")):
+            async with _serve(_make_app(mock_workflow, tools, None)) as ac:
+                await ac.post("/webhook/email", content=NO_ATTACHMENT_BODY)
+        mock_workflow.invoke.assert_called_once()
+
+    async def test_invokes_workflow(self, client, mock_workflow):
+        await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
         mock_workflow.invoke.assert_called_once()
         call_args = mock_workflow.invoke.call_args[0][0]
         assert call_args["email_message_id"] == "msg-123"
         assert call_args["has_attachment"] is True
         assert call_args["thread_id"] == "thread-456"
 
-    def test_workflow_receives_full_message_body(self, client, mock_workflow):
-        client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
+    async def test_workflow_receives_full_message_body(self, client, mock_workflow):
+        await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
         call_args = mock_workflow.invoke.call_args[0][0]
         # MockToolManager returns mock_message with "messageText", so process_email uses it
         assert call_args["email_body"] == "Full email body from Gmail API"
 
-    def test_workflow_receives_empty_state_lists(self, client, mock_workflow):
-        client.post("/webhook/email", json=VALID_WEBHOOK_PAYLOAD)
+    async def test_workflow_receives_empty_state_lists(self, client, mock_workflow):
+        await client.post("/webhook/email", content=VALID_WEBHOOK_BODY)
         call_args = mock_workflow.invoke.call_args[0][0]
         assert call_args["actions_log"] == []
         assert call_args["trajectory"] == []
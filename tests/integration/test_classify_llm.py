@@ -6,7 +6,7 @@ from src.services.prompt_store.local import LocalPromptStore
 from src.nodes.classify import ClassifyNode
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def classify_node():
     llm = OpenAILLM(model="gpt-4o-mini")
     prompt_store = LocalPromptStore("prompts", language="en")
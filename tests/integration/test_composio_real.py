@@ -13,30 +13,30 @@ TOOLKIT_VERSIONS = {
     "googlesheets": "20251027_00",
 }
 
-# Read config from .env via AppConfig (pydantic-settings)
-_config = AppConfig()
-API_KEY = _config.composio_api_key
-USER_ID = _config.composio_user_id
-SPREADSHEET_ID = _config.spreadsheet_id
-SHEET_NAME = _config.sheet_name
-
 pytestmark = pytest.mark.composio
 
 skip_reason = "Composio env vars not configured (COMPOSIO_API_KEY, COMPOSIO_USER_ID)"
-skip_if_no_key = pytest.mark.skipif(not API_KEY or USER_ID == "default", reason=skip_reason)
 
 
 @pytest.fixture(scope="module")
-def composio_mgr():
+def composio_config():
+    """Read config from .env via AppConfig, only once a test in this module actually runs."""
+    config = AppConfig()
+    if not config.composio_api_key or config.composio_user_id == "default":
+        pytest.skip(skip_reason)
+    return config
+
+
+@pytest.fixture(scope="module")
+def composio_mgr(composio_config):
     return ComposioToolManager(
-        api_key=API_KEY,
-        user_id=USER_ID,
+        api_key=composio_config.composio_api_key,
+        user_id=composio_config.composio_user_id,
         toolkit_versions=TOOLKIT_VERSIONS,
-        sheet_name=SHEET_NAME,
+        sheet_name=composio_config.sheet_name,
     )
 
 
-@skip_if_no_key
 class TestRealSendEmail:
     def test_sends_email_and_returns_ok(self, composio_mgr):
         result = composio_mgr.send_email(
@@ -59,21 +59,19 @@ class TestRealSendEmail:
         assert len(message_id) > 0
 
 
-@skip_if_no_key
 class TestRealAppendSheetRow:
-    def test_appends_row_and_returns_ok(self, composio_mgr):
-        if not SPREADSHEET_ID:
+    def test_appends_row_and_returns_ok(self, composio_mgr, composio_config):
+        if not composio_config.spreadsheet_id:
             pytest.skip("SPREADSHEET_ID not set")
 
         result = composio_mgr.append_sheet_row(
-            spreadsheet_id=SPREADSHEET_ID,
+            spreadsheet_id=composio_config.spreadsheet_id,
             values=["INT-TEST-001", "Integration Test", "Origin", "Destination", "2026-02-13", "Driver", "+000", "test"],
         )
         assert result["status"] == "ok"
         assert result["result"]["successful"] is True
 
 
-@skip_if_no_key
 class TestRealGetEmailMessage:
     def test_fetches_sent_message(self, composio_mgr):
         # Send an email first, then fetch it
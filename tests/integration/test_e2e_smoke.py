@@ -4,9 +4,12 @@ Verifies that a perfect result state scores 1.0 on all graders,
 and an imperfect result state scores < 1.0. Does NOT invoke the
 workflow (nodes are stubs) — tests the eval infrastructure only.
 """
-import json
+import functools
 from pathlib import Path
 
+import orjson
+import pytest
+
 from evals.graders.classification import ClassificationAccuracy
 from evals.graders.extraction import ExtractionAccuracy
 from evals.graders.trajectory import TrajectoryCorrectness
@@ -17,9 +20,9 @@ SCENARIOS_DIR = Path("evals/scenarios")
 FIXTURES_DIR = Path("evals/fixtures")
 
 
+@functools.lru_cache(maxsize=1)
 def _load_happy_path_scenario() -> dict:
-    with open(SCENARIOS_DIR / "happy_path.json") as f:
-        data = json.load(f)
+    data = orjson.loads((SCENARIOS_DIR / "happy_path.json").read_bytes())
     return data["scenarios"][0]
 
 
@@ -52,13 +55,23 @@ def _build_perfect_result(scenario: dict) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _happy_path_result() -> dict:
+    """Perfect result for the happy path, built once; tests must not mutate it."""
+    return _build_perfect_result(_load_happy_path_scenario())
+
+
+@pytest.fixture(scope="class")
+def happy_path(request):
+    """Attach the happy-path scenario and its perfect result to the test class."""
+    request.cls.scenario = _load_happy_path_scenario()
+    request.cls.result = _happy_path_result()
+
+
+@pytest.mark.usefixtures("happy_path")
 class TestE2ESmokePerfect:
     """Perfect result state → all graders return 1.0."""
 
-    def setup_method(self):
-        self.scenario = _load_happy_path_scenario()
-        self.result = _build_perfect_result(self.scenario)
-
     def test_pdf_fixture_loads(self):
         fixture_path = self.scenario["input"]["pdf_fixture"]
         pdf_path = FIXTURES_DIR / fixture_path
@@ -108,13 +121,10 @@ class TestE2ESmokePerfect:
         assert score.value == 1.0
 
 
+@pytest.mark.usefixtures("happy_path")
 class TestE2ESmokeImperfect:
     """Imperfect result state → graders return < 1.0."""
 
-    def setup_method(self):
-        self.scenario = _load_happy_path_scenario()
-        self.result = _build_perfect_result(self.scenario)
-
     def test_wrong_classification(self):
         grader = ClassificationAccuracy()
         score = grader.score(
@@ -125,8 +135,7 @@ class TestE2ESmokeImperfect:
 
     def test_wrong_extraction_field(self):
         grader = ExtractionAccuracy()
-        bad_data = dict(self.result["extracted_data"])
-        bad_data["customer"] = "WRONG COMPANY"
+        bad_data = {**self.result["extracted_data"], "customer": "WRONG COMPANY"}
         score = grader.score(
             extracted_data=bad_data,
             expected_extracted_data=self.result["expected_extracted_data"],
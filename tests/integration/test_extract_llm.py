@@ -20,7 +20,7 @@ EXPECTED_FIELDS = [
 ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extract_node():
     ocr = TesseractOCR()
     llm = OpenAILLM(model="gpt-4o-mini")
@@ -28,16 +28,19 @@ def extract_node():
     return ExtractNode(ocr=ocr, llm=llm, prompt_store=prompt_store)
 
 
+@pytest.fixture(scope="module")
+def happy_pdf_bytes():
+    pdf_path = FIXTURES_DIR / "happy_path" / "complete_01.pdf"
+    assert pdf_path.exists(), f"PDF fixture not found: {pdf_path}"
+    return pdf_path.read_bytes()
+
+
 @pytest.mark.integration
 class TestExtractLLMHappyPath:
-    def test_extracts_fields_from_happy_path_pdf(self, extract_node):
-        pdf_path = FIXTURES_DIR / "happy_path" / "complete_01.pdf"
-        assert pdf_path.exists(), f"PDF fixture not found: {pdf_path}"
-        pdf_bytes = pdf_path.read_bytes()
-
+    def test_extracts_fields_from_happy_path_pdf(self, extract_node, happy_pdf_bytes):
         state = {
             "is_valid_po": True,
-            "pdf_bytes": pdf_bytes,
+            "pdf_bytes": happy_pdf_bytes,
         }
 
         result = extract_node(state)
@@ -53,13 +56,10 @@ class TestExtractLLMHappyPath:
         assert result["extracted_data"]["customer"] is not None
         assert "extract" in result["trajectory"]
 
-    def test_field_confidences_present(self, extract_node):
-        pdf_path = FIXTURES_DIR / "happy_path" / "complete_01.pdf"
-        pdf_bytes = pdf_path.read_bytes()
-
+    def test_field_confidences_present(self, extract_node, happy_pdf_bytes):
         state = {
             "is_valid_po": True,
-            "pdf_bytes": pdf_bytes,
+            "pdf_bytes": happy_pdf_bytes,
         }
 
         result = extract_node(state)
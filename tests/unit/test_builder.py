@@ -4,6 +4,7 @@ from unittest.mock import patch
 import pytest
 
 from src.config import AppConfig
+from src import builder as builder_module
 from src.builder import WorkflowBuilder
 from src.services.llm.openai import OpenAILLM
 from src.services.ocr.tesseract import TesseractOCR
@@ -35,6 +36,11 @@ class TestWorkflowBuilder:
             graph = builder.build()
         assert graph is not None
 
+    def test_build_compiles_graph_once_per_builder(self):
+        with patch(MOCK_OPENAI):
+            builder = WorkflowBuilder(AppConfig.for_eval())
+            assert builder.build() is builder.build()
+
     def test_exposes_tool_manager_for_eval_inspection(self):
         with patch(MOCK_OPENAI):
             config = AppConfig.for_eval()
@@ -134,3 +140,39 @@ class TestBuilderServiceCreation:
             toolkit_versions={"gmail": "20251027_00", "googlesheets": "20251027_00"},
         )
         assert builder._tool_manager._user_id == "entity-123"
+
+    def test_llm_and_ocr_shared_across_builders_with_same_config(self):
+        with patch(MOCK_OPENAI):
+            first = WorkflowBuilder(AppConfig.for_eval())
+            second = WorkflowBuilder(AppConfig.for_eval())
+        assert first._llm is second._llm
+        assert first._ocr is second._ocr
+        assert first.tool_manager is not second.tool_manager
+
+    def test_composio_tool_manager_shared_across_builders_with_same_config(self):
+        config = AppConfig(tool_manager="composio", composio_api_key="test-key")
+        with patch(MOCK_OPENAI), patch(MOCK_COMPOSIO) as mock_cls:
+            first = WorkflowBuilder(config)
+            second = WorkflowBuilder(config)
+        assert first.tool_manager is second.tool_manager
+        mock_cls.assert_called_once()
+
+    def test_different_llm_model_gets_its_own_instance(self):
+        with patch(MOCK_OPENAI):
+            first = WorkflowBuilder(AppConfig(tool_manager="mock", llm_model="gpt-4o-mini"))
+            second = WorkflowBuilder(AppConfig(tool_manager="mock", llm_model="gpt-4o"))
+        assert first._llm is not second._llm
+
+    def test_service_cache_keys_do_not_hold_raw_credentials(self):
+        config = AppConfig(tool_manager="composio", openai_api_key="sk-secret", composio_api_key="cmp-secret")
+        with patch(MOCK_OPENAI), patch(MOCK_COMPOSIO):
+            WorkflowBuilder(config)
+        keys = repr(list(builder_module._service_cache))
+        assert "sk-secret" not in keys
+        assert "cmp-secret" not in keys
+
+    def test_service_cache_is_bounded(self):
+        with patch(MOCK_OPENAI):
+            for i in range(builder_module._SERVICE_CACHE_MAXSIZE + 5):
+                WorkflowBuilder(AppConfig(tool_manager="mock", llm_model=f"model-{i}"))
+        assert len(builder_module._service_cache) == builder_module._SERVICE_CACHE_MAXSIZE
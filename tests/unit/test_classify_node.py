@@ -1,4 +1,6 @@
 """Unit tests for ClassifyNode."""
+from unittest.mock import MagicMock, patch
+
 from src.nodes.classify import ClassifyNode
 from src.core.llm_responses import ClassificationResult
 from src.services.prompt_store.local import LocalPromptStore
@@ -40,6 +42,17 @@ class TestClassifyNodeHappyPath:
         assert result["is_valid_po"] is False
         assert result["po_id"] is None
 
+    def test_system_prompt_rendered_once(self):
+        response = ClassificationResult(is_valid_po=True, po_id="PO-001", reason="Valid")
+        node = _make_node(structured_response=response)
+
+        with patch.object(node.prompt_store, "get_and_render", wraps=node.prompt_store.get_and_render) as spy:
+            node(_valid_po_state())
+            node(_valid_po_state())
+
+        system_calls = [c for c in spy.call_args_list if c.args[:2] == ("classify", "system")]
+        assert len(system_calls) == 1
+
     def test_trajectory_updated(self):
         response = ClassificationResult(is_valid_po=True, po_id="PO-001", reason="Valid")
         node = _make_node(structured_response=response)
@@ -48,7 +61,7 @@ class TestClassifyNodeHappyPath:
 
         assert "classify" in result["trajectory"]
 
-    def test_trajectory_appends_to_existing(self):
+    def test_trajectory_returns_only_own_step(self):
         response = ClassificationResult(is_valid_po=True, po_id="PO-001", reason="Valid")
         node = _make_node(structured_response=response)
         state = _valid_po_state()
@@ -56,7 +69,7 @@ class TestClassifyNodeHappyPath:
 
         result = node(state)
 
-        assert result["trajectory"] == ["previous", "classify"]
+        assert result["trajectory"] == ["classify"]
 
 
 class TestClassifyNodeErrorHandling:
@@ -82,5 +95,55 @@ class TestClassifyNodeErrorHandling:
 
         result = node(state)
 
-        assert result["trajectory"] == ["previous", "classify"]
+        assert result["trajectory"] == ["classify"]
         assert "is_valid_po" not in result
+
+
+class TestClassifyNodeOCRPrefetch:
+    def _node(self, response=None, should_raise=None):
+        prefetch = MagicMock()
+        llm = MockLLM(structured_response=response, should_raise=should_raise)
+        node = ClassifyNode(llm=llm, prompt_store=LocalPromptStore("prompts", language="en"), ocr_prefetch=prefetch)
+        return node, prefetch
+
+    def test_starts_ocr_and_keeps_it_for_valid_po(self):
+        node, prefetch = self._node(ClassificationResult(is_valid_po=True, po_id="PO-1", reason="ok"))
+        state = {**_valid_po_state(), "pdf_bytes": b"%PDF"}
+
+        node(state)
+
+        prefetch.prefetch.assert_called_once_with(b"%PDF")
+        prefetch.discard.assert_not_called()
+
+    def test_discards_ocr_when_not_a_po(self):
+        node, prefetch = self._node(ClassificationResult(is_valid_po=False, reason="spam"))
+        state = {**_valid_po_state(), "pdf_bytes": b"%PDF"}
+
+        node(state)
+
+        prefetch.discard.assert_called_once_with(b"%PDF")
+
+    def test_discards_ocr_on_llm_error(self):
+        node, prefetch = self._node(should_raise=RuntimeError("boom"))
+        state = {**_valid_po_state(), "pdf_bytes": b"%PDF"}
+
+        result = node(state)
+
+        assert result["final_status"] == "error"
+        prefetch.discard.assert_called_once_with(b"%PDF")
+
+    def test_prefetch_error_is_reported_as_node_error(self):
+        node, prefetch = self._node(ClassificationResult(is_valid_po=True, po_id="PO-1", reason="ok"))
+        prefetch.prefetch.side_effect = RuntimeError("pool shut down")
+
+        result = node({**_valid_po_state(), "pdf_bytes": b"%PDF"})
+
+        assert result["final_status"] == "error"
+        assert "pool shut down" in result["error_message"]
+
+    def test_no_prefetch_without_pdf(self):
+        node, prefetch = self._node(ClassificationResult(is_valid_po=False, reason="no pdf"))
+
+        node(_valid_po_state())
+
+        prefetch.prefetch.assert_not_called()
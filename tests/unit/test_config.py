@@ -2,6 +2,7 @@
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from src.config import AppConfig
 
@@ -27,6 +28,8 @@ class TestAppConfig:
         assert config.prompt_fallback_language == "en"
         assert config.spreadsheet_id == ""
         assert config.opik_project == "po-workflow"
+        assert config.workflow_concurrency == 4
+        assert config.speculative_ocr is False
 
     def test_from_yaml(self, tmp_path):
         yaml_content = """\
@@ -69,6 +72,11 @@ opik_project: my-project
         assert config.prompt_store == "local"
         assert config.prompts_dir == "prompts"
 
+    def test_is_immutable(self):
+        config = AppConfig()
+        with pytest.raises(ValidationError):
+            config.tool_manager = "mock"
+
     def test_optional_fields_default_to_none(self):
         config = AppConfig()
         assert config.llm_base_url is None
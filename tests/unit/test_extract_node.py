@@ -86,14 +86,14 @@ class TestExtractNodeHappyPath:
 
         assert "extract" in result["trajectory"]
 
-    def test_trajectory_appends_to_existing(self):
+    def test_trajectory_returns_only_own_step(self):
         response = _build_response()
         node = _make_node(llm_response=response)
         state = {**_valid_state(), "trajectory": ["classify"]}
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract"]
+        assert result["trajectory"] == ["extract"]
 
 
 class TestExtractNodeSkip:
@@ -105,7 +105,7 @@ class TestExtractNodeSkip:
         result = node(state)
 
         assert "extracted_data" not in result
-        assert result["trajectory"] == ["classify", "extract"]
+        assert result["trajectory"] == ["extract"]
 
 
 class TestExtractNodeErrorHandling:
@@ -140,5 +140,5 @@ class TestExtractNodeErrorHandling:
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract"]
+        assert result["trajectory"] == ["extract"]
         assert "extracted_data" not in result
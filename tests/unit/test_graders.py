@@ -1,6 +1,8 @@
 """Unit tests for all 5 Opik BaseMetric graders."""
+import pytest
+
 from evals.graders.classification import ClassificationAccuracy
-from evals.graders.extraction import ExtractionAccuracy
+from evals.graders.extraction import ExtractionAccuracy, _normalize
 from evals.graders.trajectory import TrajectoryCorrectness
 from evals.graders.validation import ValidationCorrectness
 from evals.graders.email_quality import EmailQuality
@@ -125,6 +127,31 @@ class TestExtractionAccuracy:
         # order_id and customer match, driver_phone skipped (None in expected), rest skipped (not in expected)
         assert result.value == 1.0
 
+    def test_normalization_ignores_case_and_whitespace(self):
+        result = self.grader.score(
+            extracted_data={"order_id": "  po-001 "},
+            expected_extracted_data={"order_id": "PO-001"},
+        )
+        assert result.value == 1.0
+
+    def test_score_batch_matches_individual_scores(self):
+        rows = [
+            ({"order_id": "PO-001"}, {"order_id": "PO-001"}),
+            ({"order_id": "WRONG"}, {"order_id": "PO-001"}),
+            (None, None),
+        ]
+        results = self.grader.score_batch([a for a, _ in rows], [e for _, e in rows])
+        assert [r.value for r in results] == [1.0, 0.0, 1.0]
+
+    def test_score_batch_rejects_length_mismatch(self):
+        with pytest.raises(ValueError):
+            self.grader.score_batch([None], [])
+
+    def test_normalize_handles_non_string_values(self):
+        assert _normalize(None) is None
+        assert _normalize(42) == "42"
+        assert _normalize(" Acme ") == "acme"
+
 
 # --- TrajectoryCorrectness ---
 
@@ -198,6 +225,13 @@ class TestValidationCorrectness:
         result = self.grader.score(missing_fields=["driver_phone"], expected_missing_fields=[])
         assert result.value == 0.0
 
+    def test_verbose_false_skips_reason(self):
+        result = self.grader.score(
+            missing_fields=["driver_phone"], expected_missing_fields=["customer"], verbose=False,
+        )
+        assert result.value == 0.0
+        assert result.reason is None
+
 
 # --- EmailQuality ---
 
@@ -1,4 +1,6 @@
 """Unit tests for MockToolManager."""
+import pytest
+
 from src.services.tools.mock import MockToolManager
 
 
@@ -65,6 +67,28 @@ class TestMockToolManager:
         assert len(mock.sheet_rows_added) == 2
         assert all(c["action"] == "append_sheet_row" for c in mock.sheet_rows_added)
 
+    def test_calls_by_action_groups_calls(self):
+        mock = MockToolManager()
+        mock.get_email_message(message_id="m1")
+        mock.send_email(to="a@b.com", subject="S", body="B")
+        assert [c["message_id"] for c in mock.calls_by_action["get_email_message"]] == ["m1"]
+        assert "get_email_attachment" not in mock.calls_by_action
+
+    def test_calls_by_action_is_a_copy(self):
+        mock = MockToolManager()
+        mock.send_email(to="a@b.com", subject="S", body="B")
+        mock.calls_by_action["send_email"].clear()
+        mock.emails_sent.clear()
+        assert len(mock.emails_sent) == 1
+        assert type(mock.calls_by_action) is dict
+
+    def test_assert_called_matches_fields(self):
+        mock = MockToolManager()
+        mock.send_email(to="a@b.com", subject="S", body="B")
+        assert mock.assert_called("send_email", to="a@b.com")["subject"] == "S"
+        with pytest.raises(AssertionError):
+            mock.assert_called("send_email", to="other@b.com")
+
     def test_all_calls_returns_everything(self):
         mock = MockToolManager()
         mock.send_email(to="a@b.com", subject="S", body="B")
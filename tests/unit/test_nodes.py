@@ -181,3 +181,19 @@ class TestReportNode:
             node({})
         except NotImplementedError:
             pytest.fail("ReportNode should be implemented")
+
+
+class TestGraphTrajectory:
+    def test_reducer_accumulates_node_steps(self):
+        from src.workflow import build_graph
+
+        def step(name, **updates):
+            return lambda state: {"trajectory": [name], **updates}
+
+        nodes = {name: step(name) for name in ["extract", "validate", "track", "notify", "report"]}
+        nodes["classify"] = step("classify", is_valid_po=True)
+        graph = build_graph(nodes)
+
+        result = graph.invoke({"trajectory": []})
+
+        assert result["trajectory"] == ["classify", "extract", "validate", "track", "notify", "report"]
@@ -85,7 +85,7 @@ class TestNotifyNodeSkip:
 
         assert tools.emails_sent == []
         assert "confirmation_email_sent" not in result
-        assert result["trajectory"] == ["classify", "notify"]
+        assert result["trajectory"] == ["notify"]
 
 
 class TestNotifyNodeTrajectory:
@@ -102,7 +102,7 @@ class TestNotifyNodeTrajectory:
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract", "validate", "track", "notify"]
+        assert result["trajectory"] == ["notify"]
 
 
 class TestNotifyNodeErrorHandling:
@@ -131,5 +131,5 @@ class TestNotifyNodeErrorHandling:
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract", "notify"]
+        assert result["trajectory"] == ["notify"]
         assert tools.emails_sent == []
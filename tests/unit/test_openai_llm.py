@@ -26,7 +26,16 @@ class TestOpenAILLMConstructor:
     def test_passes_base_url_and_api_key_to_client(self):
         with patch("src.services.llm.openai.OpenAI") as mock_cls:
             OpenAILLM(model="gpt-4o", base_url="https://custom.api", api_key="sk-test")
-            mock_cls.assert_called_once_with(base_url="https://custom.api", api_key="sk-test")
+            kwargs = mock_cls.call_args.kwargs
+            assert kwargs["base_url"] == "https://custom.api"
+            assert kwargs["api_key"] == "sk-test"
+
+    def test_instances_share_one_http_client(self):
+        with patch("src.services.llm.openai.OpenAI") as mock_cls:
+            OpenAILLM(model="gpt-4o")
+            OpenAILLM(model="gpt-4o-mini")
+        first, second = (c.kwargs["http_client"] for c in mock_cls.call_args_list)
+        assert first is second
 
 
 class TestStructuredOutput:
@@ -0,0 +1,75 @@
+"""Unit tests for PrefetchingOCR."""
+import contextvars
+
+from src.services.ocr.base import OCRService
+from src.services.ocr.prefetch import PrefetchingOCR
+
+
+class CountingOCR(OCRService):
+    def __init__(self):
+        self.calls = 0
+
+    def extract_text(self, pdf_bytes: bytes) -> str:
+        self.calls += 1
+        return f"text:{len(pdf_bytes)}"
+
+
+class TestPrefetchingOCR:
+    def test_implements_ocr_service(self):
+        assert isinstance(PrefetchingOCR(CountingOCR()), OCRService)
+
+    def test_extract_without_prefetch_runs_inline(self):
+        inner = CountingOCR()
+        ocr = PrefetchingOCR(inner)
+        assert ocr.extract_text(b"abc") == "text:3"
+        assert inner.calls == 1
+
+    def test_extract_reuses_prefetched_result(self):
+        inner = CountingOCR()
+        ocr = PrefetchingOCR(inner)
+        pdf = b"pdf-bytes"
+
+        ocr.prefetch(pdf)
+        ocr.prefetch(pdf)  # already pending: no second OCR run
+        assert ocr.extract_text(pdf) == "text:9"
+        assert inner.calls == 1
+        assert ocr._pending == {}
+
+    def test_copy_of_prefetched_bytes_reuses_result(self):
+        inner = CountingOCR()
+        ocr = PrefetchingOCR(inner)
+
+        ocr.prefetch(b"pdf-bytes")
+        assert ocr.extract_text(bytes(bytearray(b"pdf-bytes"))) == "text:9"
+        assert inner.calls == 1
+        assert ocr._pending == {}
+
+    def test_discard_drops_pending_prefetch(self):
+        inner = CountingOCR()
+        ocr = PrefetchingOCR(inner)
+        pdf = b"pdf-bytes"
+
+        ocr.prefetch(pdf)
+        ocr.discard(pdf)
+
+        assert ocr._pending == {}
+        ocr.discard(pdf)  # no-op when nothing is pending
+
+    def test_prefetch_runs_in_callers_context(self):
+        trace_id = contextvars.ContextVar("trace_id", default=None)
+        seen = []
+
+        class ContextOCR(OCRService):
+            def extract_text(self, pdf_bytes: bytes) -> str:
+                seen.append(trace_id.get())
+                return ""
+
+        ocr = PrefetchingOCR(ContextOCR())
+        token = trace_id.set("trace-1")
+        try:
+            ocr.prefetch(b"pdf")
+        finally:
+            trace_id.reset(token)
+        ocr.extract_text(b"pdf")
+
+        assert seen == ["trace-1"]
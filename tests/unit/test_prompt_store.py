@@ -1,7 +1,9 @@
 """Unit tests for LocalPromptStore."""
+import shutil
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from src.services.prompt_store.base import PromptStore, PromptTemplate
 from src.services.prompt_store.local import LocalPromptStore
@@ -54,6 +56,18 @@ class TestLocalPromptStore:
         result = PromptStore.render(template, {"name": "Juan", "order_id": "PO-001"})
         assert result == "Hello Juan, order PO-001."
 
+    def test_render_matches_str_format(self):
+        for text in ("Hi {name}, JSON: {{\"id\": {order_id}}}", "{order_id:>8}|{name!r}"):
+            template = PromptTemplate(name="test", template=text, params=["name", "order_id"])
+            params = {"name": "Juan", "order_id": 7}
+            assert PromptStore.render(template, params) == text.format(**params)
+
+    def test_template_is_immutable(self):
+        template = PromptTemplate(name="test", template="Hello {name}.", params=["name"])
+        with pytest.raises(ValidationError):
+            template.template = "Bye {name}."
+        assert PromptStore.render(template, {"name": "Juan"}) == "Hello Juan."
+
     def test_render_raises_for_missing_required_params(self):
         template = PromptTemplate(
             name="test",
@@ -88,14 +102,18 @@ class TestLocalPromptStore:
         assert template is not None
         assert "clasificador de emails" in template.template
 
-    def test_caching(self):
+    def test_preloads_categories_at_init(self, tmp_path):
+        shutil.copytree(FIXTURES_DIR, tmp_path, dirs_exist_ok=True)
+        store = LocalPromptStore(tmp_path, language="es", fallback_language="en")
+        # Files are read once at construction; later changes on disk are not seen
+        shutil.rmtree(tmp_path / "es")
+        shutil.rmtree(tmp_path / "en")
+        assert "clasificador de emails" in store.get("classify", "system").template
+        assert "Analyze this email" in store.get("classify", "user").template
+
+    def test_get_returns_memoized_template(self):
         store = LocalPromptStore(FIXTURES_DIR, language="en")
-        # First call loads from file
-        store.get("classify", "system")
-        assert "en/classify" in store._cache
-        # Second call uses cache — verify cache key exists
-        store.get("classify", "system")
-        assert "en/classify" in store._cache
+        assert store.get("classify", "system") is store.get("classify", "system")
 
     def test_prompt_template_has_correct_params(self):
         store = LocalPromptStore(FIXTURES_DIR, language="en")
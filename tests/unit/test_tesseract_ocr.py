@@ -1,14 +1,17 @@
 """Unit tests for TesseractOCR service (mocked pdf2image and pytesseract)."""
+import subprocess
 from unittest.mock import MagicMock, patch
 
 from src.services.ocr.tesseract import TesseractOCR
 
 
 class TestTesseractOCRConstructor:
-    def test_defaults_lang_eng_dpi_300(self):
+    def test_defaults_lang_eng_dpi_200(self):
         ocr = TesseractOCR()
         assert ocr._lang == "eng"
-        assert ocr._dpi == 300
+        assert ocr._dpi == 200
+        assert ocr._tesseract_config == "--oem 1 --psm 6"
+        assert ocr._workers >= 1
 
     def test_accepts_custom_lang_and_dpi(self):
         ocr = TesseractOCR(lang="spa", dpi=150)
@@ -25,13 +28,13 @@ class TestExtractText:
         mock_convert.return_value = [img1, img2]
         mock_tess.image_to_string.side_effect = ["Page one text", "Page two text"]
 
-        ocr = TesseractOCR(lang="eng", dpi=300)
+        ocr = TesseractOCR(lang="eng", dpi=300, workers=2)
         ocr.extract_text(b"fake-pdf-bytes")
 
-        mock_convert.assert_called_once_with(b"fake-pdf-bytes", dpi=300)
+        mock_convert.assert_called_once_with(b"fake-pdf-bytes", dpi=300, grayscale=True, thread_count=2)
         assert mock_tess.image_to_string.call_count == 2
-        mock_tess.image_to_string.assert_any_call(img1, lang="eng")
-        mock_tess.image_to_string.assert_any_call(img2, lang="eng")
+        mock_tess.image_to_string.assert_any_call(img1, lang="eng", config="--oem 1 --psm 6")
+        mock_tess.image_to_string.assert_any_call(img2, lang="eng", config="--oem 1 --psm 6")
 
     @patch("src.services.ocr.tesseract.pytesseract")
     @patch("src.services.ocr.tesseract.convert_from_bytes")
@@ -46,6 +49,18 @@ class TestExtractText:
         assert "Second page" in result
         assert result == "First page\nSecond page"
 
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    def test_parallel_pages_keep_page_order(self, mock_convert, mock_tess):
+        pages = [MagicMock(name=f"page{i}") for i in range(5)]
+        mock_convert.return_value = pages
+        mock_tess.image_to_string.side_effect = lambda img, lang, config: img._mock_name
+
+        ocr = TesseractOCR(workers=4)
+        result = ocr.extract_text(b"fake-pdf")
+
+        assert result == "page0\npage1\npage2\npage3\npage4"
+
     @patch("src.services.ocr.tesseract.pytesseract")
     @patch("src.services.ocr.tesseract.convert_from_bytes")
     def test_strips_whitespace(self, mock_convert, mock_tess):
@@ -78,3 +93,91 @@ class TestExtractText:
         result = ocr.extract_text(b"one-page-pdf")
 
         assert result == "Only page"
+
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    def test_reuses_page_pool_across_calls(self, mock_convert, mock_tess):
+        mock_convert.return_value = [MagicMock(), MagicMock()]
+        mock_tess.image_to_string.return_value = "text"
+
+        ocr = TesseractOCR(workers=2)
+        ocr.extract_text(b"first")
+        pool = ocr._pool
+        ocr.extract_text(b"second")
+
+        assert pool is not None
+        assert ocr._pool is pool
+
+
+class TestTextLayer:
+    @staticmethod
+    def _pdftotext(stdout: bytes, returncode: int = 0):
+        return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=b"")
+
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    @patch("src.services.ocr.tesseract.subprocess.run")
+    def test_native_text_skips_ocr(self, mock_run, mock_convert, mock_tess):
+        page = b"Purchase Order PO-2024-001 Customer: Acme Corp Pickup: Madrid " * 2
+        mock_run.return_value = self._pdftotext(page + b"\f")
+
+        result = TesseractOCR().extract_text(b"pdf")
+
+        assert result == page.decode().strip()
+        mock_convert.assert_not_called()
+        mock_tess.image_to_string.assert_not_called()
+
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    @patch("src.services.ocr.tesseract.subprocess.run")
+    def test_sparse_text_falls_back_to_ocr(self, mock_run, mock_convert, mock_tess):
+        mock_run.return_value = self._pdftotext(b"  \f  \f")
+        mock_convert.return_value = [MagicMock()]
+        mock_tess.image_to_string.return_value = "OCR text"
+
+        assert TesseractOCR().extract_text(b"scanned-pdf") == "OCR text"
+
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    @patch("src.services.ocr.tesseract.subprocess.run", side_effect=FileNotFoundError)
+    def test_missing_pdftotext_falls_back_to_ocr(self, mock_run, mock_convert, mock_tess):
+        mock_convert.return_value = [MagicMock()]
+        mock_tess.image_to_string.return_value = "OCR text"
+
+        assert TesseractOCR().extract_text(b"pdf") == "OCR text"
+
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    @patch("src.services.ocr.tesseract.subprocess.run")
+    def test_text_layer_can_be_disabled(self, mock_run, mock_convert, mock_tess):
+        mock_convert.return_value = [MagicMock()]
+        mock_tess.image_to_string.return_value = "OCR text"
+
+        assert TesseractOCR(use_text_layer=False).extract_text(b"pdf") == "OCR text"
+        mock_run.assert_not_called()
+
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    @patch("src.services.ocr.tesseract.subprocess.run")
+    def test_image_only_pdf_is_ocrd_with_default_config(self, mock_run, mock_convert, mock_tess):
+        # Scanned PDF: pdftotext succeeds but finds no text, so pages go to Tesseract
+        mock_run.return_value = self._pdftotext(b"\f")
+        page = MagicMock()
+        mock_convert.return_value = [page]
+        mock_tess.image_to_string.return_value = "Scanned PO text"
+
+        assert TesseractOCR(lang="spa").extract_text(b"scanned-pdf") == "Scanned PO text"
+        mock_tess.image_to_string.assert_called_once_with(page, lang="spa", config="--oem 1 --psm 6")
+
+    @patch("src.services.ocr.tesseract.pytesseract")
+    @patch("src.services.ocr.tesseract.convert_from_bytes")
+    @patch("src.services.ocr.tesseract.subprocess.run")
+    def test_custom_tesseract_config_is_passed_through(self, mock_run, mock_convert, mock_tess):
+        mock_run.return_value = self._pdftotext(b"\f")
+        page = MagicMock()
+        mock_convert.return_value = [page]
+        mock_tess.image_to_string.return_value = "text"
+
+        TesseractOCR(tesseract_config="--psm 3").extract_text(b"scanned-pdf")
+
+        mock_tess.image_to_string.assert_called_once_with(page, lang="eng", config="--psm 3")
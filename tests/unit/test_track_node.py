@@ -80,7 +80,7 @@ class TestTrackNodeHappyPath:
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract", "validate", "track"]
+        assert result["trajectory"] == ["track"]
 
 
 class TestTrackNodeSkip:
@@ -92,7 +92,7 @@ class TestTrackNodeSkip:
 
         assert "sheet_row_added" not in result
         assert tools.sheet_rows_added == []
-        assert result["trajectory"] == ["classify", "track"]
+        assert result["trajectory"] == ["track"]
 
 
 class TestTrackNodeErrorHandling:
@@ -106,6 +106,6 @@ class TestTrackNodeErrorHandling:
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract", "validate", "track"]
+        assert result["trajectory"] == ["track"]
         assert "sheet_row_added" not in result
         assert tools.sheet_rows_added == []
@@ -53,7 +53,7 @@ class TestValidateNodeHappyPath:
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract", "validate"]
+        assert result["trajectory"] == ["validate"]
 
 
 class TestValidateNodeMissingFields:
@@ -128,5 +128,5 @@ class TestValidateNodeErrorHandling:
 
         result = node(state)
 
-        assert result["trajectory"] == ["classify", "extract", "validate"]
+        assert result["trajectory"] == ["validate"]
         assert "missing_fields" not in result
@@ -10,6 +10,7 @@ from pydantic import ValidationError
 from src.core.webhook import (
     ComposioWebhookPayload,
     WebhookPayload,
+    is_obviously_not_po,
     parse_composio_webhook,
 )
 
@@ -170,3 +171,47 @@ class TestParseComposioWebhook:
         result = parse_composio_webhook(composio_payload)
 
         assert result.sender == "plain@example.com"
+
+
+def _webhook(subject="Hello", body="Quick question", filenames=()):
+    return WebhookPayload(
+        message_id="msg-1",
+        subject=subject,
+        body=body,
+        sender="a@b.com",
+        has_attachment=bool(filenames),
+        attachment_ids=[f"att-{i}" for i in range(len(filenames))],
+        attachment_filenames=list(filenames),
+    )
+
+
+class TestIsObviouslyNotPO:
+    def test_short_email_without_pdf_or_po_reference(self):
+        assert is_obviously_not_po(_webhook()) is True
+
+    def test_any_attachment_is_kept(self):
+        # Gmail often labels PDFs application/octet-stream; never trust the type
+        for name in ("PO_4512.pdf", "scan.bin", "photo.png"):
+            assert is_obviously_not_po(_webhook(filenames=[name])) is False
+
+    def test_octet_stream_pdf_from_parser_is_kept(self):
+        payload = {
+            "data": {
+                "message_id": "msg-1",
+                "message_text": "Attached",
+                "attachment_list": [
+                    {"attachmentId": "a", "filename": "PO_4512.pdf", "mimeType": "application/octet-stream"},
+                ],
+            },
+        }
+        webhook = parse_composio_webhook(ComposioWebhookPayload(**payload))
+        assert is_obviously_not_po(webhook) is False
+
+    def test_po_reference_is_kept(self):
+        assert is_obviously_not_po(_webhook(subject="Re: po-2024-001")) is False
+        assert is_obviously_not_po(_webhook(body="see PO 123")) is False
+        assert is_obviously_not_po(_webhook(body="P.O. #4512")) is False
+        assert is_obviously_not_po(_webhook(subject="Purchase order attached")) is False
+
+    def test_long_body_is_kept(self):
+        assert is_obviously_not_po(_webhook(body="x" * 200)) is False